@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     import numpy.typing as npt
 
     from framesss.fea.boundary_conditions.element_load import ElementLoad
+    from framesss.fea.boundary_conditions.nodal_load import NodalLoad
     from framesss.fea.element_1d import Element1D
     from framesss.fea.models.model import Model
     from framesss.fea.node import Node
@@ -149,22 +150,7 @@ class FrameXZAnalysis(Analysis):
         :param model: A reference to an instance of the :class:`Model` class.
         :param load_case: A reference to an instance of the :class:`LoadCase` class.
         """
-        for node, load in load_case.nodal_loads.items():
-            node_idx = node.id
-            # Add applied force in global X coordinate_system
-            load_case.f_global[
-                model.dof_connectivity_matrix[0, node_idx]
-            ] += load.load_components[0]
-
-            # Add applied force in global Z coordinate_system
-            load_case.f_global[
-                model.dof_connectivity_matrix[2, node_idx]
-            ] += load.load_components[2]
-
-            # Add applied moment about global Y coordinate_system
-            load_case.f_global[
-                model.dof_connectivity_matrix[1, node_idx]
-            ] += load.load_components[4]
+        self._add_nodal_loads(model, load_case.f_global, load_case.nodal_loads)
 
     def assemble_nodal_loads_nonlinear_combination(
         self, model: Model, combination: NonlinearLoadCaseCombination
@@ -179,22 +165,41 @@ class FrameXZAnalysis(Analysis):
         :param combination: A reference to an instance of the :class:`NonlinearLoadCaseCombination` class.
         """
         for load_case, factor in combination.load_cases.items():
-            for node, load in load_case.nodal_loads.items():
-                node_idx = node.id
-                # Add applied force in global X coordinate_system
-                combination.f_global[model.dof_connectivity_matrix[0, node_idx]] += (
-                    load.load_components[0] * factor
-                )
+            self._add_nodal_loads(
+                model, combination.f_global, load_case.nodal_loads, factor
+            )
 
-                # Add applied force in global Z coordinate_system
-                combination.f_global[model.dof_connectivity_matrix[2, node_idx]] += (
-                    load.load_components[2] * factor
-                )
+    @staticmethod
+    def _add_nodal_loads(
+        model: Model,
+        f_global: npt.NDArray[np.float64],
+        nodal_loads: dict[Node, NodalLoad],
+        factor: float = 1.0,
+    ) -> None:
+        """
+        Add factored nodal load components to a global force vector in one scatter.
 
-                # Add applied moment about global Y coordinate_system
-                combination.f_global[model.dof_connectivity_matrix[1, node_idx]] += (
-                    load.load_components[4] * factor
-                )
+        :param model: A reference to an instance of the :class:`Model` class.
+        :param f_global: The global force vector to be updated in place.
+        :param nodal_loads: A dictionary mapping nodes to their applied nodal loads.
+        :param factor: A scaling factor applied to all load components.
+        :raises ValueError: If any of the loaded nodes has not been numbered.
+        """
+        if not nodal_loads:
+            return
+
+        node_ids = [node.id for node in nodal_loads if node.id is not None]
+        if len(node_ids) != len(nodal_loads):
+            raise ValueError(
+                "Nodal loads can be assembled only for nodes numbered within the model."
+            )
+        node_idx = np.array(node_ids, dtype=np.int64)
+        components = np.array([load.load_components for load in nodal_loads.values()])
+
+        # Rows of the DoF connectivity matrix are translation in X, rotation about Y
+        # and translation in Z, i.e. load components Fx, My and Fz.
+        dofs = model.dof_connectivity_matrix[:, node_idx]
+        np.add.at(f_global, dofs, factor * components[:, [0, 4, 2]].T)
 
     def get_fixed_end_forces(self, load: ElementLoad) -> npt.NDArray[np.float64]:
         """
@@ -360,84 +365,58 @@ class FrameXZAnalysis(Analysis):
             element.save_peak_points_for_shear_force_xz_eqn(case)
             element.save_peak_points_for_bending_moment_xz_eqn(case)
 
-        # Initialize empty arrays
-        axial_forces = np.array([])
-        shear_forces_z = np.array([])
-        bending_moments_y = np.array([])
-
-        peak_x_local = np.array([])
-        peak_axial_forces = np.array([])
-        peak_shear_forces_z = np.array([])
-        peak_bending_moments_y = np.array([])
+        # Collect internal forces at sampling points and at peak points of every element,
+        # and join them by a single concatenation
+        sampled = []
+        peaks = []
 
-        # Loop through every element
         for element in member.generated_elements:
             x = element.sampling_points
             x_peaks = element.peak_points[case]
 
-            peak_x_local = np.append(peak_x_local, x_peaks + element.x_start)
-
-            # Get axial forces
-            axial_forces = np.append(axial_forces, element.get_axial_force(case, x))
-            peak_axial_forces = np.append(
-                peak_axial_forces, element.get_axial_force(case, x_peaks)
-            )
-
-            # Get shear forces
-            shear_forces_z = np.append(
-                shear_forces_z, element.get_shear_force_xz(case, x)
+            sampled.append(
+                [
+                    element.get_axial_force(case, x),
+                    element.get_shear_force_xz(case, x),
+                    element.get_bending_moment_xz(case, x),
+                ]
             )
-            peak_shear_forces_z = np.append(
-                peak_shear_forces_z, element.get_shear_force_xz(case, x_peaks)
+            peaks.append(
+                [
+                    x_peaks + element.x_start,
+                    element.get_axial_force(case, x_peaks),
+                    element.get_shear_force_xz(case, x_peaks),
+                    element.get_bending_moment_xz(case, x_peaks),
+                ]
             )
 
-            # Get bending moments
-            bending_moments_y = np.append(
-                bending_moments_y, element.get_bending_moment_xz(case, x)
-            )
-            peak_bending_moments_y = np.append(
-                peak_bending_moments_y, element.get_bending_moment_xz(case, x_peaks)
-            )
+        axial_forces, shear_forces_z, bending_moments_y = np.concatenate(
+            sampled, axis=1
+        )
 
         # Save results
         # Stack arrays and get only unique records for peak values
-        data = np.vstack(
-            [
-                peak_x_local,
-                peak_axial_forces,
-                peak_shear_forces_z,
-                peak_bending_moments_y,
-            ]
-        )
+        data = np.unique(np.concatenate(peaks, axis=1), axis=1)
         peak_x_local, peak_axial_forces, peak_shear_forces_z, peak_bending_moments_y = (
-            np.unique(data, axis=1)
+            data
         )
 
+        # Extremes of all three internal forces at once
+        min_max = np.column_stack([data[1:].min(axis=1), data[1:].max(axis=1)])
+
         member.results.peak_x_local[case] = peak_x_local
 
         member.results.axial_forces[case] = axial_forces
         member.results.peak_axial_forces[case] = peak_axial_forces
-        min_max_axial_forces = np.array(
-            [np.min(peak_axial_forces), np.max(peak_axial_forces)]
-        )
-        member.results.min_max_axial_forces[case] = min_max_axial_forces
+        member.results.min_max_axial_forces[case] = min_max[0]
 
         member.results.shear_forces_z[case] = shear_forces_z
         member.results.peak_shear_forces_z[case] = peak_shear_forces_z
-        min_max_shear_forces_z = np.array(
-            [np.min(peak_shear_forces_z), np.max(peak_shear_forces_z)]
-        )
-        member.results.min_max_shear_forces_z[case] = min_max_shear_forces_z
+        member.results.min_max_shear_forces_z[case] = min_max[1]
 
         member.results.bending_moments_y[case] = bending_moments_y
         member.results.peak_bending_moments_y[case] = peak_bending_moments_y
-        min_max_bending_moments_y = np.array(
-            [
-                np.min(peak_bending_moments_y),
-                np.max(peak_bending_moments_y),
-            ]
-        )
-        member.results.min_max_bending_moments_y[case] = min_max_bending_moments_y
+        member.results.min_max_bending_moments_y[case] = min_max[2]
 
     def save_envelope_stresses(
         self, member: Member1D, envelope: EnvelopeCombination
@@ -526,16 +505,30 @@ class FrameXZAnalysis(Analysis):
         :param member: A reference to an instance of the :class:`Member1D` class.
         :param load_combination: A reference to an instance of the :class:`LoadCaseCombination` class.
         """
-        member.results.translations_x[load_combination] = np.zeros(member.x_local.shape)
-        member.results.translations_z[load_combination] = np.zeros(member.x_local.shape)
+        factors = np.fromiter(
+            load_combination.load_cases.values(),
+            dtype=np.float64,
+            count=len(load_combination.load_cases),
+        )
 
-        for load_case, factor in load_combination.load_cases.items():
-            member.results.translations_x[load_combination] += (
-                factor * member.results.translations_x[load_case]
-            )
-            member.results.translations_z[load_combination] += (
-                factor * member.results.translations_z[load_case]
-            )
+        n_points = member.x_local.shape[0]
+
+        # Superimpose the translations of all load cases by one vector-matrix product,
+        # the explicit shape gives zero translations for a combination without load cases
+        member.results.translations_x[load_combination] = factors @ np.reshape(
+            [
+                member.results.translations_x[load_case]
+                for load_case in load_combination.load_cases
+            ],
+            (-1, n_points),
+        )
+        member.results.translations_z[load_combination] = factors @ np.reshape(
+            [
+                member.results.translations_z[load_case]
+                for load_case in load_combination.load_cases
+            ],
+            (-1, n_points),
+        )
 
     def save_internal_displacements_on_member_envelope(
         self, member: Member1D, envelope: EnvelopeCombination
@@ -594,8 +587,8 @@ class FrameXZAnalysis(Analysis):
         """
         Save the reaction forces and moments for a specified node under a given load combination.
 
-        This method extracts reaction forces and moments from the global force vector for the specified
-        :class:`LoadCase` and assigns them to the corresponding node results.
+        This method extracts reaction forces and moments from the global force vector superimposed by
+        :meth:`LoadCaseCombination.superimpose_load_cases` and assigns them to the corresponding node results.
 
         :param node: A reference to an instance of the :class:`Node` class.
         :param load_combination: A reference to an instance of the :class:`LoadCaseCombination` class.
@@ -605,27 +598,14 @@ class FrameXZAnalysis(Analysis):
         direction is not `SupportFixity.FIXED_DOF` (i.e. reaction storage for a particular direction
         is None), this method will not attempt to save reactions in that direction.
         """
-        for load_case, factor in load_combination.load_cases.items():
-            if node.results.reaction_force_x.get(load_case) is not None:
-                if node.results.reaction_force_x.get(load_combination) is None:
-                    node.results.reaction_force_x[load_combination] = 0
-                node.results.reaction_force_x[load_combination] += (
-                    factor * load_case.f_global[node.global_dofs[0]]
-                )
+        if (rfx := node.results.reaction_force_x) is not None:
+            rfx[load_combination] = load_combination.f_global[node.global_dofs[0]]
 
-            if node.results.reaction_moment_y.get(load_case) is not None:
-                if node.results.reaction_moment_y.get(load_combination) is None:
-                    node.results.reaction_moment_y[load_combination] = 0
-                node.results.reaction_moment_y[load_combination] += (
-                    factor * load_case.f_global[node.global_dofs[1]]
-                )
+        if (rmy := node.results.reaction_moment_y) is not None:
+            rmy[load_combination] = load_combination.f_global[node.global_dofs[1]]
 
-            if node.results.reaction_force_z.get(load_case) is not None:
-                if node.results.reaction_force_z.get(load_combination) is None:
-                    node.results.reaction_force_z[load_combination] = 0
-                node.results.reaction_force_z[load_combination] += (
-                    factor * load_case.f_global[node.global_dofs[2]]
-                )
+        if (rfz := node.results.reaction_force_z) is not None:
+            rfz[load_combination] = load_combination.f_global[node.global_dofs[2]]
 
     def save_reactions_envelope(
         self, node: Node, envelope: EnvelopeCombination
@@ -696,19 +676,15 @@ class FrameXZAnalysis(Analysis):
         """
         Save the displacements for a specified node under a given load combination.
 
-        This method extracts displacements from the global displacement vector for the
-        specified :class:`LoadCase` and assigns them to the corresponding node results.
+        This method extracts displacements from the global displacement vector superimposed by
+        :meth:`LoadCaseCombination.superimpose_load_cases` and assigns them to the corresponding
+        node results.
 
         :param node: A reference to an instance of the :class:`Node` class.
         :param load_combination: A reference to an instance of the :class:`LoadCaseCombination` class.
         """
-        node.results.translation_x[load_combination] = 0.0
-        node.results.rotation_y[load_combination] = 0.0
-        node.results.translation_z[load_combination] = 0.0
-
-        for load_case, factor in load_combination.load_cases.items():
-            u_g = load_case.u_global[node.global_dofs]
+        u_g = load_combination.u_global[node.global_dofs]
 
-            node.results.translation_x[load_combination] += factor * u_g[0]
-            node.results.rotation_y[load_combination] += factor * u_g[1]
-            node.results.translation_z[load_combination] += factor * u_g[2]
+        node.results.translation_x[load_combination] = u_g[0]
+        node.results.rotation_y[load_combination] = u_g[1]
+        node.results.translation_z[load_combination] = u_g[2]
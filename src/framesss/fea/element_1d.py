@@ -6,6 +6,7 @@ import numpy as np
 
 from framesss.enums import BeamConnection
 from framesss.enums import Element1DType
+from framesss.utils import transform_stiffness_to_global
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -177,20 +178,19 @@ class Element1D:
             f"hinges={hinge_descriptions})"
         )
 
-    def get_element_global_stiffness_matrix(
+    def get_element_local_stiffness_matrix(
         self,
         nonlinear_combination: NonlinearLoadCaseCombination | None = None,
         modulus_type: str = "tangent",
     ) -> npt.NDArray[np.float64]:
         """
-        Return element stiffness matrix in global system.
+        Compute, store and return element stiffness matrix in local system.
 
         :param nonlinear_combination: Reference to :class:`NonlinearLoadCaseCombination`.
         :param modulus_type: The type of modulus to use for the calculation.
                              Can be either 'tangent' or 'secant'.
-        :return: Element stiffness matrix in global system.
+        :return: Element stiffness matrix in local system.
         """
-        # Compute and store member stiffness matrix in local system
         self.stiffness_matrix_local = (
             self.member.analysis.get_element_local_stiffness_matrix(
                 self,
@@ -199,14 +199,28 @@ class Element1D:
             )
         )
 
-        # Transform member stiffness matrix from local to global system
-        keg = (
-            self.member.transformation_matrix.T
-            @ self.stiffness_matrix_local
-            @ self.member.transformation_matrix
+        return self.stiffness_matrix_local
+
+    def get_element_global_stiffness_matrix(
+        self,
+        nonlinear_combination: NonlinearLoadCaseCombination | None = None,
+        modulus_type: str = "tangent",
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return element stiffness matrix in global system.
+
+        :param nonlinear_combination: Reference to :class:`NonlinearLoadCaseCombination`.
+        :param modulus_type: The type of modulus to use for the calculation.
+                             Can be either 'tangent' or 'secant'.
+        :return: Element stiffness matrix in global system.
+        """
+        # Compute and store member stiffness matrix in local system
+        kel = self.get_element_local_stiffness_matrix(
+            nonlinear_combination=nonlinear_combination, modulus_type=modulus_type
         )
 
-        return keg
+        # Transform member stiffness matrix from local to global system
+        return transform_stiffness_to_global(kel, self.member.transformation_matrix)
 
     def get_element_internal_actions(
         self, load_case: LoadCase
@@ -122,14 +122,13 @@ class Model:
                                  [kx, ky, kz, krx, kry, krz], representing translational and rotational spring
                                  stiffness values in the X, Y, and Z directions, respectively.
         """
-        fixities = [SupportFixity(fix) for fix in fixity]
         spring_stiff = [stiff for stiff in spring_stiffness]
 
         coords = [coords[i] if i < len(coords) else 0 for i in range(3)]
         new_node = Node(
             label=label,
             coords=coords,
-            fixity=fixities,
+            fixity=fixity,
             spring_stiffness=spring_stiff,
             is_user_defined=True,
         )
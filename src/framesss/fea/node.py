@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -28,6 +29,26 @@ SUPPORT_FIXITIES = [
 ]
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_fixity(fixity: tuple[str, ...]) -> tuple[SupportFixity | None, ...]:
+    """
+    Convert a tuple of fixity strings to :class:`SupportFixity` members.
+
+    Models reuse a handful of fixity patterns for all their nodes, so the case-insensitive
+    enum lookups are done once per distinct pattern.
+
+    :param fixity: A tuple of fixity conditions.
+    :return: A tuple of parsed fixities, with ``None`` in place of every invalid entry.
+    """
+    parsed: list[SupportFixity | None] = []
+    for fix in fixity:
+        try:
+            parsed.append(SupportFixity(fix))
+        except ValueError:
+            parsed.append(None)
+    return tuple(parsed)
+
+
 class Node:
     """
     Represent a node within a finite element analysis (FEA) model.
@@ -55,7 +76,7 @@ class Node:
         self,
         label: str,
         coords: list[float] | npt.NDArray[np.float64],
-        fixity: list[SupportFixity],
+        fixity: list[SupportFixity] | list[str] | tuple[str, ...],
         spring_stiffness: list[float],
         is_user_defined: bool = False,
     ) -> None:
@@ -81,7 +102,7 @@ class Node:
         )
 
     def validate_fixity(
-        self, fixity: list[SupportFixity] | list[str]
+        self, fixity: list[SupportFixity] | list[str] | tuple[str, ...]
     ) -> list[SupportFixity]:
         """
         Validate the fixity conditions provided for a node.
@@ -91,7 +112,7 @@ class Node:
         is valid according to predefined SupportFixity values.
 
         :param fixity: A list of fixity conditions to be validated.
-        :return: Same fixity list if it passes all validations.
+        :return: A new list of fixities if it passes all validations.
         :raises: ValueError if the fixity list is not valid.
         """
         if len(fixity) != 6:
@@ -99,17 +120,17 @@ class Node:
                 f"Fixity at node '{self.label}' must have 6 elements. Got {len(fixity)} elements."
             )
 
-        fixities = []
+        fixities = _parse_fixity(tuple(fixity))
 
-        for i, fix in enumerate(fixity):
-            if fix not in SUPPORT_FIXITIES:
-                raise ValueError(
-                    f"Invalid fixity: '{fix}' for the node: '{self.label}' at the index {i}\n"
-                    f"Valid fixities are: {SUPPORT_FIXITIES}."
-                )
-            fixities.append(SupportFixity(fix))
+        if None in fixities:
+            i = fixities.index(None)
+            raise ValueError(
+                f"Invalid fixity: '{fixity[i]}' for the node: '{self.label}' at the index {i}\n"
+                f"Valid fixities are: {SUPPORT_FIXITIES}."
+            )
 
-        return fixities
+        # The model mutates fixities of individual nodes, hence each node gets its own list.
+        return [fix for fix in fixities if fix is not None]
 
     def get_elements_incidence(self, model: Model) -> tuple[int, int]:
         """
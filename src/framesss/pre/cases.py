@@ -69,21 +69,19 @@ class LoadCase:
         to any term of the global forcing vector, including the terms that
         correspond to constrained DoFs.
         """
-        for elem, distributed_load in self.element_distributed_loads.items():
-            # get global dofs
-            dofs = elem.global_dofs
-            # get member equivalent nodal loads
-            feg = distributed_load.get_equivalent_nodal_actions()
-            # assemble equivalent nodal loads to global force vector
-            self.f_global[dofs] += feg
-
-        for elem, thermal_load in self.element_thermal_loads.items():
-            # get global dofs
-            dofs = elem.global_dofs
-            # get member equivalent nodal loads
-            feg = thermal_load.get_equivalent_nodal_actions()
-            # assemble equivalent nodal loads to global force vector
-            self.f_global[dofs] += feg
+        element_loads = [
+            *self.element_distributed_loads.values(),
+            *self.element_thermal_loads.values(),
+        ]
+        if not element_loads:
+            return
+
+        # get global dofs and member equivalent nodal loads of all loaded elements
+        dofs = np.array([load.element.global_dofs for load in element_loads])
+        feg = np.array([load.get_equivalent_nodal_actions() for load in element_loads])
+        # assemble equivalent nodal loads to global force vector, accumulating
+        # contributions of elements that share a DoF
+        np.add.at(self.f_global, dofs, feg)
 
 
 class LoadCaseCombination:
@@ -93,12 +91,21 @@ class LoadCaseCombination:
     :param label: A unique identifier for the load combination.
     :ivar load_cases: A dictionary mapping :class:`LoadCase` instances
                         to their scaling factors.
+    :ivar f_global: The global force vector of the combination, superimposed from the solved
+                    load cases.
+    :ivar u_global: The global displacement vector of the combination, superimposed from the
+                    solved load cases.
+    :ivar is_superimposed: A boolean flag indicating whether the global vectors have been
+                           superimposed from the solved load cases.
     """
 
     def __init__(self, label: str, load_cases: dict[LoadCase, float]) -> None:
         """Init the LoadCaseCombination class."""
         self.label = label
         self.load_cases = load_cases
+        self.f_global: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self.u_global: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        self.is_superimposed: bool = False
 
     def __repr__(self) -> str:
         """Return a string representation of LoadCaseCombination object."""
@@ -113,6 +120,28 @@ class LoadCaseCombination:
         """
         self.load_cases[load_case] = factor
 
+    def superimpose_load_cases(self, neq: int) -> None:
+        """
+        Superimpose the global force and displacement vectors of the solved load cases.
+
+        The vectors of all load cases are stacked as rows, so each combined vector is obtained
+        by a single vector-matrix product with the scaling factors. A combination without
+        any load cases results in zero vectors.
+
+        :param neq: The number of equations of the model, i.e. the length of the global vectors.
+        """
+        factors = np.fromiter(
+            self.load_cases.values(), dtype=np.float64, count=len(self.load_cases)
+        )
+
+        self.f_global = factors @ np.reshape(
+            [load_case.f_global for load_case in self.load_cases], (-1, neq)
+        )
+        self.u_global = factors @ np.reshape(
+            [load_case.u_global for load_case in self.load_cases], (-1, neq)
+        )
+        self.is_superimposed = True
+
 
 class NonlinearLoadCaseCombination(LoadCase):
     """Represent a combination of load cases for nonlinear analysis."""
@@ -14,6 +14,16 @@ class Material:
     G = E / [2 * (1 + v)], where G is the shear modulus, E is the elastic modulus, and v is Poisson's ratio.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "density",
+        "elastic_modulus",
+        "label",
+        "poissons_ratio",
+        "shear_modulus",
+        "thermal_expansion_coefficient",
+    )
+
     def __init__(
         self,
         label: str,
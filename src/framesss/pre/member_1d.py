@@ -131,6 +131,7 @@ class Member1D:
 
         self.generated_nodes: list[Node] = []
         self.generated_elements: list[Element1D] = []
+        self._x_local: npt.NDArray[np.float64] | None = None
 
         self.x_user_defined_nodes: npt.NDArray[np.float64] = np.array(
             [0.0, self.length]
@@ -159,13 +160,21 @@ class Member1D:
 
     @property
     def x_local(self) -> npt.NDArray[np.float64]:
-        """Return the x-coordinates along the local x-axis."""
-        return np.concatenate(
-            [
-                element.x_start + element.sampling_points
-                for element in self.generated_elements
-            ]
-        )
+        """
+        Return the x-coordinates along the local x-axis.
+
+        The coordinates are concatenated once from the generated elements and cached (as a read-only
+        array) until the member is discretized again.
+        """
+        if self._x_local is None:
+            self._x_local = np.concatenate(
+                [
+                    element.x_start + element.sampling_points
+                    for element in self.generated_elements
+                ]
+            )
+            self._x_local.flags.writeable = False
+        return self._x_local
 
     def get_direction_cosine_matrix(self) -> npt.NDArray[np.float64]:
         """
@@ -364,7 +373,6 @@ class Member1D:
                                       value. Can be an instance of :class:`CoordinateDefinition`.
                                       Default to ``RELATIVE``.
         """
-        fixities = [SupportFixity(fix) for fix in fixity]
         spring_stiff = [stiff for stiff in spring_stiffness]
         coord_def = CoordinateDefinition(coordinate_definition)
 
@@ -377,7 +385,7 @@ class Member1D:
         new_node = Node(
             label=label,
             coords=coords,
-            fixity=fixities,
+            fixity=fixity,
             spring_stiffness=spring_stiff,
             is_user_defined=True,
         )
@@ -605,6 +613,8 @@ class Member1D:
         the first element gets the original member's start hinge setting, the last element
         gets the end hinge setting, and all intermediate elements are set to continuous.
         """
+        self._x_local = None
+
         for i, (node_1, node_2, x_1, x_2) in enumerate(
             zip(
                 self.generated_nodes[:-1],
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-import scipy as sp  # type: ignore[import-untyped]
 
 from framesss.enums import CoordinateDefinition
 from framesss.enums import DistributedLoadLocation
@@ -19,6 +18,22 @@ if TYPE_CHECKING:
 LOAD_COORDINATE_SYSTEMS = [LoadCoordinateSystem.LOCAL, LoadCoordinateSystem.GLOBAL]
 
 
+def _rotate_components(
+    load_components: npt.NDArray[np.float64], rotation: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Rotate both component triplets of a six-component load vector.
+
+    Equivalent to ``block_diag(rotation, rotation) @ load_components`` without assembling
+    the 6x6 block diagonal matrix.
+
+    :param load_components: Array of six load components, two triplets in the same system.
+    :param rotation: The 3x3 rotation matrix applied to each triplet.
+    :return: Array of the rotated load components.
+    """
+    return (load_components.reshape(2, 3) @ rotation.T).ravel()
+
+
 class PointLoadOnMember:
     """
     Represents a point load (forces and moments) acting on a member.
@@ -62,7 +77,7 @@ class PointLoadOnMember:
         self.x = x
 
         self.components_global, self.components_local = self.set_load_components(
-            np.array(load_components), coordinate_system
+            np.array(load_components, dtype=np.float64), coordinate_system
         )
         self.load_case = load_case
         self.coordinate_system = coordinate_system
@@ -106,18 +121,18 @@ class PointLoadOnMember:
 
         :raises ValueError: If the specified coordinate system is neither 'global' nor 'local'.
         """
-        load_components = np.array(load_components)
-
-        transformation_matrix = sp.linalg.block_diag(
-            self.member.direction_cosine_matrix, self.member.direction_cosine_matrix
-        )
+        load_components = np.asarray(load_components, dtype=np.float64)
 
         if coordinate_system == LoadCoordinateSystem.GLOBAL:
             components_global = load_components
-            components_local = transformation_matrix @ load_components
+            components_local = _rotate_components(
+                load_components, self.member.direction_cosine_matrix
+            )
 
         elif coordinate_system == LoadCoordinateSystem.LOCAL:
-            components_global = transformation_matrix.T @ load_components
+            components_global = _rotate_components(
+                load_components, self.member.direction_cosine_matrix.T
+            )
             components_local = load_components
 
         else:
@@ -202,9 +217,9 @@ class DistributedLoadOnMember:
         else:
             raise ValueError("wtf just happened.")
 
-        self.components = np.array(load_components)
+        self.components = np.array(load_components, dtype=np.float64)
         self.components_global, self.components_local = self.set_load_components(
-            np.array(load_components), coordinate_system, location
+            self.components, coordinate_system, location
         )
         self.load_case = load_case
         self.coordinate_system = coordinate_system
@@ -255,25 +270,18 @@ class DistributedLoadOnMember:
 
         :raises ValueError: If the specified coordinate system is neither 'global' nor 'local'.
         """
-        load_components = np.array(load_components)
-
-        transformation_matrix = sp.linalg.block_diag(
-            self.member.direction_cosine_matrix, self.member.direction_cosine_matrix
-        )
+        load_components = np.asarray(load_components, dtype=np.float64)
 
         if (
             location == DistributedLoadLocation.PROJECTION
             and coordinate_system == LoadCoordinateSystem.GLOBAL
         ):
-            cosine = np.tile(
-                [
-                    (1 - self.member.cosine_x**2) ** 0.5,
-                    (1 - self.member.cosine_y**2) ** 0.5,
-                    (1 - self.member.cosine_z**2) ** 0.5,
-                ],
-                2,
+            direction_cosines = np.array(
+                [self.member.cosine_x, self.member.cosine_y, self.member.cosine_z]
             )
-            load_components = load_components * cosine
+            # Scale both component triplets, i.e. at the start and at the end of the load
+            cosine = np.sqrt(1 - direction_cosines**2)
+            load_components = (load_components.reshape(2, 3) * cosine).ravel()
 
         elif (
             location == DistributedLoadLocation.PROJECTION
@@ -286,10 +294,14 @@ class DistributedLoadOnMember:
 
         if coordinate_system == LoadCoordinateSystem.GLOBAL:
             components_global = load_components
-            components_local = transformation_matrix @ load_components
+            components_local = _rotate_components(
+                load_components, self.member.direction_cosine_matrix
+            )
 
         elif coordinate_system == LoadCoordinateSystem.LOCAL:
-            components_global = transformation_matrix.T @ load_components
+            components_global = _rotate_components(
+                load_components, self.member.direction_cosine_matrix.T
+            )
             components_local = load_components
 
         else:
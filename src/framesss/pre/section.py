@@ -26,6 +26,21 @@ class Section:
     :param moment_curvature: The moment-curvature relation of the section.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "area_x",
+        "area_y",
+        "area_z",
+        "height_y",
+        "height_z",
+        "inertia_x",
+        "inertia_y",
+        "inertia_z",
+        "label",
+        "material",
+        "moment_curvature",
+    )
+
     def __init__(
         self,
         label: str,
@@ -149,6 +164,8 @@ class PolygonalSection(Section):
     :param material: The material of the section.
     """
 
+    __slots__ = ("n_points", "points", "y", "z")
+
     def __init__(
         self, label: str, points: list[list[float]], material: Material
     ) -> None:
@@ -222,6 +239,8 @@ class RectangularSection(PolygonalSection):
     :param material: The material of the section.
     """
 
+    __slots__ = ("b", "h")
+
     def __init__(self, label: str, b: float, h: float, material: Material) -> None:
         """Init the RectangularSection class."""
         self.b = b
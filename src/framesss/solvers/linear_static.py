@@ -1,17 +1,38 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import numpy as np
 import scipy as sp  # type: ignore[import-untyped]
 
 from framesss.solvers.solver import Solver
-from framesss.utils import is_invertible
 from framesss.errors import SingularMatrixError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+    from typing_extensions import TypeAlias
+
     from framesss.fea.models.model import Model
     from framesss.pre.cases import LoadCase
+    from framesss.pre.cases import NonlinearLoadCaseCombination
+
+    SolveFunction: TypeAlias = Callable[
+        [npt.NDArray[np.float64]], npt.NDArray[np.float64]
+    ]
+    # Solve function of the factorized k_ff followed by the k_fc, k_cf and k_cc partitions
+    Factorization: TypeAlias = tuple[
+        SolveFunction,
+        sp.sparse.csr_matrix,
+        sp.sparse.csr_matrix,
+        sp.sparse.csr_matrix,
+    ]
+
+# Systems up to this number of free DoFs are factorized as dense matrices, for which LAPACK
+# is faster than the overhead of the sparse machinery
+MAX_DENSE_EQUATIONS = 200
 
 
 class LinearStaticSolver(Solver):
@@ -20,13 +41,172 @@ class LinearStaticSolver(Solver):
     def __init__(self, model: Model) -> None:
         """Init the LinearStaticSolver object."""
         super().__init__(model)
+        self._factorization: Factorization | None = None
+
+    def init_global_matrices_vectors(self) -> None:
+        """
+        Initialize global matrices and vectors for the model.
+
+        See :meth:`Solver.init_global_matrices_vectors`. The stored factorization of the previous
+        global stiffness matrix is discarded.
+        """
+        super().init_global_matrices_vectors()
+        self._factorization = None
+
+    def assemble_global_stiffness_matrix(
+        self,
+        nonlinear_combination: NonlinearLoadCaseCombination | None = None,
+        modulus_type: str = "tangent",
+    ) -> None:
+        """
+        Assembles the global stiffness matrix for the entire model using the sparse CSR format.
+
+        See :meth:`Solver.assemble_global_stiffness_matrix`. The stored factorization of the previous
+        global stiffness matrix is discarded.
+
+        :param nonlinear_combination: Reference to :class:`NonlinearLoadCaseCombination`.
+        :param modulus_type: The type of modulus to use for calculation.
+                             Can be either 'tangent' or 'secant'.
+        """
+        super().assemble_global_stiffness_matrix(nonlinear_combination, modulus_type)
+        self._factorization = None
+
+    def factorize_stiffness_matrix(self) -> Factorization:
+        """
+        Partition the global stiffness matrix and factorize its free-free block.
+
+        The factorization of k_ff is computed once and stored on the solver, so that every
+        load case of the model is solved by a forward/backward substitution against the same factor.
+        Small systems are factorized as dense matrices, larger ones as sparse matrices.
+        The stored factorization is discarded whenever the global stiffness matrix is assembled again.
+
+        :return: A tuple of the function solving k_ff * u_f = b and the k_fc, k_cf
+                 and k_cc partitions of the global stiffness matrix.
+        :raises SingularMatrixError: If the free-free global stiffness matrix is singular (unstable).
+        """
+        k_global = sp.sparse.csr_matrix(self.model.k_global)
+
+        n_free = self.model.neq_free + self.model.neq_spring
+        neq = self.model.neq
+
+        # Assemble free-free global matrix
+        k_ff = k_global[:n_free, :n_free]
+
+        if n_free == 0:
+            # All DoFs are fixed, the LAPACK routines reject an empty matrix
+            k_ff_solve: SolveFunction = np.copy
+        elif n_free <= MAX_DENSE_EQUATIONS:
+            k_ff_solve = self._factorize_dense(k_ff)
+        else:
+            k_ff_solve = self._factorize_sparse(k_ff)
+
+        # Partition system of equations
+        k_fc = k_global[:n_free, n_free:neq].tocsr()
+        k_cf = k_global[n_free:neq, :n_free].tocsr()
+        k_cc = k_global[n_free:neq, n_free:neq].tocsr()
+
+        self._factorization = (k_ff_solve, k_fc, k_cf, k_cc)
+
+        return self._factorization
+
+    @staticmethod
+    def _check_condition(rcond: float, k_ff: sp.sparse.csr_matrix) -> None:
+        """
+        Check for stable k_ff global matrix by its estimated reciprocal condition number.
+
+        The 1-norm condition number is estimated from the factorization at the cost of a few
+        substitutions, which spares a rank computation of the dense matrix. A reciprocal condition
+        number of round-off size (n * eps), the tolerance numpy's matrix_rank applies to
+        the singular values, indicates that the matrix is singular. The pivots of the factorization
+        are not reliable for this purpose, a mechanism can leave all of them well above round-off.
+
+        :param rcond: The estimated reciprocal condition number of k_ff.
+        :param k_ff: The free-free global stiffness matrix.
+        :raises SingularMatrixError: If the free-free global stiffness matrix is singular (unstable).
+        """
+        # Written as a negation, so that a NaN estimate is treated as singular as well
+        if not rcond > k_ff.shape[0] * np.finfo(np.float64).eps:
+            raise SingularMatrixError(
+                f"Singular stiffness matrix. Reciprocal condition number: {rcond}",
+                matrix=k_ff,
+            )
+
+    def _factorize_dense(self, k_ff: sp.sparse.csr_matrix) -> SolveFunction:
+        """
+        Factorize k_ff by the dense LU factorization.
+
+        :return: Function solving the system k_ff * u_f = b for the right-hand side(s) b.
+        :raises SingularMatrixError: If the free-free global stiffness matrix is singular (unstable).
+        """
+        lu, piv, info = sp.linalg.lapack.dgetrf(
+            k_ff.toarray(order="F"), overwrite_a=True
+        )
+        if info > 0:
+            raise SingularMatrixError(
+                f"Singular stiffness matrix. Zero pivot at equation {info}.",
+                matrix=k_ff,
+            )
+
+        rcond, _ = sp.linalg.lapack.dgecon(lu, sp.sparse.linalg.norm(k_ff, 1), norm="1")
+        self._check_condition(rcond, k_ff)
+
+        return functools.partial(sp.linalg.lu_solve, (lu, piv), check_finite=False)
+
+    def _factorize_sparse(self, k_ff: sp.sparse.csr_matrix) -> SolveFunction:
+        """
+        Factorize k_ff by the sparse LU factorization.
+
+        The columns are ordered by the structure of the symmetric k_ff + k_ff^T and diagonal pivots
+        are preferred.
+
+        :return: Function solving the system k_ff * u_f = b for the right-hand side(s) b.
+        :raises SingularMatrixError: If the free-free global stiffness matrix is singular (unstable).
+        """
+        try:
+            k_ff_lu = sp.sparse.linalg.splu(
+                k_ff.tocsc(),
+                permc_spec="MMD_AT_PLUS_A",
+                options={"SymmetricMode": True},
+            )
+        except RuntimeError as error:
+            raise SingularMatrixError(
+                f"Singular stiffness matrix. {error}", matrix=k_ff
+            ) from error
+
+        # Estimate the 1-norm of the inverse of k_ff by substitutions against its factors
+        k_ff_inverse = sp.sparse.linalg.LinearOperator(
+            k_ff.shape,
+            matvec=k_ff_lu.solve,
+            rmatvec=functools.partial(k_ff_lu.solve, trans="T"),
+            dtype=np.float64,
+        )
+        rcond = 1.0 / (
+            sp.sparse.linalg.norm(k_ff, 1) * sp.sparse.linalg.onenormest(k_ff_inverse)
+        )
+        self._check_condition(rcond, k_ff)
+
+        k_ff_solve: SolveFunction = k_ff_lu.solve
+
+        return k_ff_solve
 
     def solve_load_case(self, load_case: LoadCase) -> None:
         """
         Solve the system of equilibrium equations for a specific load case.
 
-        The method divides the stiffness matrix (k_global), the force vector (f_global),
-        and the displacement vector (u_global) based on the DoFs categorizations:
+        See :meth:`solve_load_cases`, which solves several load cases at once.
+
+        :param load_case: The load case being solved, including applied loads and predefined displacements.
+        :raises SingularMatrixError: If the free-free global stiffness matrix is singular (unstable),
+                                    indicating an ill-conditioned system that cannot be reliably solved.
+        """
+        self.solve_load_cases([load_case])
+
+    def solve_load_cases(self, load_cases: list[LoadCase]) -> None:
+        """
+        Solve the system of equilibrium equations for several load cases at once.
+
+        The method divides the stiffness matrix (k_global), the force vectors (f_global),
+        and the displacement vectors (u_global) based on the DoFs categorizations:
 
           - f: free DoFs (numbered first), natural B.C. (unknown)
           - s: spring DoFs (numbered after free DoFs), natural B.C. (unknown)
@@ -38,41 +218,32 @@ class LinearStaticSolver(Solver):
         [ k_ff k_fc ] * [ u_f ] = [ f_f ]
         [ k_cf k_cc ] * [ u_c ] = [ f_c ]
 
-        The method then solves for the unknown displacements and updates the global displacement and force
-        vectors with the solved values and computed reactions.
+        The force and displacement vectors of all load cases are stacked as columns, so the unknown
+        displacements are found by a single substitution against the factorized k_ff. The method then
+        updates the global displacement and force vectors of each load case with the solved values and
+        computed reactions.
 
-        :param load_case: The load case being solved, including applied loads and predefined displacements.
-        :raises ValueError: If the free-free global stiffness matrix is singular (unstable), indicating an
-                            ill-conditioned system that cannot be reliably solved.
+        :param load_cases: The load cases being solved, including applied loads and predefined displacements.
+        :raises SingularMatrixError: If the free-free global stiffness matrix is singular (unstable),
+                                    indicating an ill-conditioned system that cannot be reliably solved.
         """
-        k_global = sp.sparse.lil_matrix(self.model.k_global)
-
-        neq_free = self.model.neq_free
-        neq_spring = self.model.neq_spring
-        neq = self.model.neq
+        factorization = self._factorization
+        if factorization is None:
+            factorization = self.factorize_stiffness_matrix()
+        k_ff_solve, k_fc, k_cf, k_cc = factorization
 
-        # Assemble free-free global matrix
-        k_ff = k_global[: (neq_free + neq_spring), : (neq_free + neq_spring)].tocsr()
-
-        # Check for stable k_ff global matrix by verifying its determinant (a very low
-        # determinant indicates that the matrix is badly conditioned and may be singular)
-        if not is_invertible(k_ff.todense()):
-            raise SingularMatrixError(
-                f"Singular stiffness matrix. Determinant: {np.linalg.det(k_ff.todense())}",
-                matrix=k_ff,
-            )
+        if not load_cases:
+            return
 
-        # Partition system of equations
-        k_fc = k_global[: (neq_free + neq_spring), (neq_free + neq_spring) : neq]
-        k_cf = k_global[(neq_free + neq_spring) : neq, : (neq_free + neq_spring)]
-        k_cc = k_global[(neq_free + neq_spring) : neq, (neq_free + neq_spring) : neq]
+        n_free = self.model.neq_free + self.model.neq_spring
 
-        f_f = load_case.f_global[: (neq_free + neq_spring)]
-        f_c = load_case.f_global[(neq_free + neq_spring) :]
+        f_global = np.column_stack([load_case.f_global for load_case in load_cases])
+        f_f = f_global[:n_free]
+        f_c = f_global[n_free:]
 
-        u_c = load_case.u_global[(neq_free + neq_spring) :]
+        u_c = np.column_stack([load_case.u_global[n_free:] for load_case in load_cases])
 
-        u_f = sp.sparse.linalg.spsolve(k_ff, f_f - k_fc @ u_c)
+        u_f = k_ff_solve(f_f - k_fc @ u_c)
 
         # Recover forcing unknown values (reactions) at essential B.C. It is assumed that the
         # f_c vector currently stores combined nodal loads applied directly to fixed DoFs.
@@ -80,19 +251,20 @@ class LinearStaticSolver(Solver):
         # that were applied directly to fixed DoFs
         f_c = -f_c + k_cf @ u_f + k_cc @ u_c
 
-        # Initialise spring reaction vector
-        f_s = np.zeros(self.model.neq_spring)
-
+        # Spring reactions
         for i in range(self.model.neq_spring):
-            f_s[i] = (
+            f_f[self.model.neq_free + i] = (
                 -self.model.spring_stiffness_global[i] * u_f[self.model.neq_free + i]
             )
 
-        f_f[self.model.neq_free : self.model.neq_free + self.model.neq_spring] = f_s
+        # Reconstruct the global force vectors f_global and the global displacement vectors u_global,
+        # stored row-wise so that each load case gets a contiguous view
+        u_global = np.concatenate([u_f, u_c]).T.copy()
+        f_global = np.concatenate([f_f, f_c]).T.copy()
 
-        # Reconstruct the global force vector f_global and the global displacement vector u_global
-        load_case.u_global = np.concatenate([u_f, u_c])
-        load_case.f_global = np.concatenate([f_f, f_c])
+        for load_case, u, f in zip(load_cases, u_global, f_global):
+            load_case.u_global = u
+            load_case.f_global = f
 
     def solve(self, verbose: bool = False) -> None:
         """
@@ -105,7 +277,7 @@ class LinearStaticSolver(Solver):
         :param verbose: If True, detailed progress of each analysis step is printed to the console.
         """
         steps_init = 6
-        steps_cases = len(self.model.load_cases) * 7
+        steps_cases = len(self.model.load_cases) * 6 + 1
         steps_combs = len(self.model.load_combinations) * 3
         steps_envelopes = len(self.model.envelopes) * 1
         n_steps = steps_init + steps_cases + steps_combs + steps_envelopes
@@ -139,39 +311,42 @@ class LinearStaticSolver(Solver):
             print(f"6/{n_steps} : Assembling global stiffness matrix...")
         self.assemble_global_stiffness_matrix()
         self.model.analysis.assemble_spring_stiffness(self.model)
+        self.factorize_stiffness_matrix()
 
-        for i, load_case in enumerate(self.model.load_cases):
+        load_cases = list(self.model.load_cases)
+
+        for i, load_case in enumerate(load_cases):
             if verbose:
                 print(
-                    f"{i*7 + steps_init + 1}/{n_steps}"
+                    f"{i*3 + steps_init + 1}/{n_steps}"
                     f" : Applying prescribed displacements for load case: '{load_case.label}..."
                 )
             self.model.analysis.apply_prescribed_displacements(self.model, load_case)
 
             if verbose:
                 print(
-                    f"{i*7 + steps_init + 2}/{n_steps}"
+                    f"{i*3 + steps_init + 2}/{n_steps}"
                     f" : Applying nodal forces for load case: '{load_case.label}'..."
                 )
             self.model.analysis.assemble_nodal_loads(self.model, load_case)
 
             if verbose:
                 print(
-                    f"{i*7 + steps_init + 3}/{n_steps}"
+                    f"{i*3 + steps_init + 3}/{n_steps}"
                     f" : Applying member forces for load case: '{load_case.label}'..."
                 )
             load_case.assemble_equivalent_nodal_loads()
 
-            if verbose:
-                print(
-                    f"{i*7 + steps_init + 3}/{n_steps}"
-                    f" : Solving load case: '{load_case.label}'..."
-                )
-            self.solve_load_case(load_case)
+        steps_solve = len(load_cases) * 3 + steps_init + 1
+
+        if verbose:
+            print(f"{steps_solve}/{n_steps} : Solving all load cases...")
+        self.solve_load_cases(load_cases)
 
+        for i, load_case in enumerate(load_cases):
             if verbose:
                 print(
-                    f"{i*7 + steps_init + 4}/{n_steps}"
+                    f"{i*3 + steps_solve + 1}/{n_steps}"
                     f" : Computing reactions for load case: '{load_case.label}'..."
                 )
             self.save_displacements(load_case)
@@ -179,7 +354,7 @@ class LinearStaticSolver(Solver):
 
             if verbose:
                 print(
-                    f"{i*7 + steps_init + 5}/{n_steps}"
+                    f"{i*3 + steps_solve + 2}/{n_steps}"
                     f" : Computing internal forces for load case: '{load_case.label}'..."
                 )
             self.save_element_internal_forces(load_case)
@@ -187,7 +362,7 @@ class LinearStaticSolver(Solver):
 
             if verbose:
                 print(
-                    f"{i*7 + steps_init + 6}/{n_steps}"
+                    f"{i*3 + steps_solve + 3}/{n_steps}"
                     f" : Computing internal displacements for load case: '{load_case.label}'..."
                 )
             self.save_member_internal_displacements(load_case)
@@ -201,6 +376,7 @@ class LinearStaticSolver(Solver):
                     f" : Computing internal forces for load combination: "
                     f"'{load_combination.label}'..."
                 )
+            load_combination.superimpose_load_cases(self.model.neq)
             self.save_displacements_combination(load_combination)
             self.save_reactions_combination(load_combination)
 
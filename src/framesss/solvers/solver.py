@@ -7,14 +7,25 @@ from typing import TYPE_CHECKING
 import numpy as np
 import scipy as sp  # type: ignore[import-untyped]
 
+from framesss.utils import transform_stiffness_to_global
+
 if TYPE_CHECKING:
     import numpy.typing as npt
+    from typing_extensions import TypeAlias
 
+    from framesss.fea.element_1d import Element1D
     from framesss.fea.models.model import Model
     from framesss.pre.cases import EnvelopeCombination, NonlinearLoadCaseCombination
     from framesss.pre.cases import LoadCase
     from framesss.pre.cases import LoadCaseCombination
 
+    AssemblyPattern: TypeAlias = tuple[
+        list[Element1D],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.int64],
+        npt.NDArray[np.int64],
+    ]
+
 
 class Solver(ABC):
     """
@@ -36,6 +47,9 @@ class Solver(ABC):
     def __init__(self, model: Model) -> None:
         """Init the Solver object."""
         self.model = model
+        # Elements, their transformation matrices and COO indices of their stiffness
+        # entries, reused by every stiffness matrix assembly until the DoFs are renumbered
+        self._assembly_pattern: AssemblyPattern | None = None
 
     def __repr__(self) -> str:
         """Return class representation of Class object."""
@@ -53,58 +67,85 @@ class Solver(ABC):
         Global force and displacement vectors for each load case are initialized with zeros, ready to
         be populated with specific values as the analysis progresses.
         """
-        self.model.k_global = sp.sparse.coo_matrix((self.model.neq, self.model.neq))
+        self.model.k_global = sp.sparse.csr_matrix((self.model.neq, self.model.neq))
+        self._assembly_pattern = None
 
         for case in self.model.load_cases.union(self.model.nonlinear_load_combinations):
             case.f_global = np.zeros(self.model.neq)
             case.u_global = np.zeros(self.model.neq)
 
+        # Combined vectors are superimposed again from the newly solved load cases
+        for combination in self.model.load_combinations:
+            combination.is_superimposed = False
+
     def assemble_global_stiffness_matrix(
         self,
         nonlinear_combination: NonlinearLoadCaseCombination | None = None,
         modulus_type: str = "tangent",
     ) -> None:
         """
-        Assembles the global stiffness matrix for the entire model using the sparse COO format.
+        Assembles the global stiffness matrix for the entire model using the sparse CSR format.
 
         This method iterates over all elements in the model, extracting each element's stiffness matrix and
         its associated global degrees of freedom (DoFs). These matrices are then combined into a single global
-        stiffness matrix. The sparse COO format is utilized to efficiently store and manage the non-zero values
-        of the stiffness matrix.
+        stiffness matrix. The entries are collected as COO triplets, whose duplicates are summed by a single
+        conversion to the CSR format used for slicing and factorization of the stiffness matrix.
 
         :param nonlinear_combination: Reference to :class:`NonlinearLoadCaseCombination`.
         :param modulus_type: The type of modulus to use for calculation.
                              Can be either 'tangent' or 'secant'.
         """
-        row: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
-        col: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
-        data: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
-
-        for element in self.model.elements:
-            dofs = element.global_dofs
-            n_dofs = len(dofs)
-
-            keg = element.get_element_global_stiffness_matrix(
-                nonlinear_combination=nonlinear_combination, modulus_type=modulus_type
-            )
-
-            r = np.repeat(dofs, n_dofs)
-            c = np.tile(dofs, n_dofs)
-
-            k = keg.flatten()
+        if self._assembly_pattern is None:
+            self._assembly_pattern = self.get_assembly_pattern()
+        elements, t, row, col = self._assembly_pattern
+
+        # Compute and store element stiffness matrices in local system
+        k_local = np.array(
+            [
+                element.get_element_local_stiffness_matrix(
+                    nonlinear_combination=nonlinear_combination,
+                    modulus_type=modulus_type,
+                )
+                for element in elements
+            ]
+        )
 
-            row = np.hstack((row, r))
-            col = np.hstack((col, c))
-            data = np.hstack((data, k))
+        # Transform all element stiffness matrices to global system by one batched product
+        keg = transform_stiffness_to_global(k_local, t)
+        data = keg.ravel()
 
         k_global = sp.sparse.coo_matrix(
             (data, (row, col)), shape=(self.model.neq, self.model.neq)
-        )
+        ).tocsr()
 
         # TODO: Assemble spring stiffness here
 
         self.model.k_global = k_global
 
+    def get_assembly_pattern(self) -> AssemblyPattern:
+        """
+        Return the parts of the stiffness matrix assembly that depend only on the model topology.
+
+        Member geometry and global DoF numbers do not change between assemblies of a single
+        analysis, so the stacked element transformation matrices and the COO row and column
+        indices of all element stiffness entries are computed once per DoF numbering.
+
+        :return: A tuple of the model elements, their stacked transformation matrices and
+                 the row and column indices of their stiffness entries in the global matrix.
+        """
+        elements = list(self.model.elements)
+
+        t = np.array([element.member.transformation_matrix for element in elements])
+
+        # COO indices, row-major within each element block
+        dofs = np.array([element.global_dofs for element in elements])
+        n_dofs = dofs.shape[1]
+
+        row = np.repeat(dofs, n_dofs, axis=1).ravel()
+        col = np.tile(dofs, n_dofs).ravel()
+
+        return elements, t, row, col
+
     def save_element_internal_forces(self, load_case: LoadCase) -> None:
         """
         Calculate and save the internal forces for each element in the model under a specified load case.
@@ -233,6 +274,9 @@ class Solver(ABC):
 
         :param load_combination: A reference to an instance of the :class:`LoadCaseCombination` class.
         """
+        if not load_combination.is_superimposed:
+            load_combination.superimpose_load_cases(self.model.neq)
+
         for node in self.model.nodes:
             self.model.analysis.save_reactions_combination(node, load_combination)
 
@@ -272,6 +316,9 @@ class Solver(ABC):
 
         :param load_combination: A reference to an instance of the :class:`LoadCaseCombination` class.
         """
+        if not load_combination.is_superimposed:
+            load_combination.superimpose_load_cases(self.model.neq)
+
         for node in self.model.nodes:
             self.model.analysis.save_displacements_combination(node, load_combination)
 
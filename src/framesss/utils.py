@@ -51,6 +51,22 @@ def assemble_subarray_at_indices(
     array[rows, cols] += subarray.flatten()
 
 
+def transform_stiffness_to_global(
+    k_local: npt.NDArray[np.float64], t: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Transform element stiffness matrices from local to global system as ``t.T @ k_local @ t``.
+
+    Works for a single element as well as for a stack of elements, whose matrices are then
+    transformed by one batched product.
+
+    :param k_local: Element stiffness matrix (n x n) or a stack of them (m x n x n) in local system.
+    :param t: Transformation matrix (n x n) or a stack of them (m x n x n), matching ``k_local``.
+    :return: Element stiffness matrix or a stack of them in global system.
+    """
+    return t.swapaxes(-1, -2) @ k_local @ t
+
+
 def is_invertible(a: npt.NDArray[np.float64]) -> bool:
     """
     Check if a given matrix is invertible.
@@ -1,10 +1,12 @@
 """Test cases for the utils module."""
 
 import numpy as np
+from numpy.testing import assert_array_almost_equal
 from numpy.testing import assert_array_equal
 
 from framesss.utils import assemble_subarray_at_indices
 from framesss.utils import is_invertible
+from framesss.utils import transform_stiffness_to_global
 
 
 def test_assemble_subarray_at_indices() -> None:
@@ -33,3 +35,16 @@ def test_is_invertible() -> None:
 
     assert is_invertible(a)
     assert not is_invertible(b)
+
+
+def test_transform_stiffness_to_global() -> None:
+    k_local = np.random.rand(3, 6, 6)
+    t = np.random.rand(3, 6, 6)
+
+    k_global = transform_stiffness_to_global(k_local, t)
+
+    for i in range(3):
+        assert_array_almost_equal(k_global[i], t[i].T @ k_local[i] @ t[i])
+        assert_array_almost_equal(
+            transform_stiffness_to_global(k_local[i], t[i]), k_global[i]
+        )
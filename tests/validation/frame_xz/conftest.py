@@ -0,0 +1,22 @@
+from collections.abc import Callable
+
+import pytest
+
+from framesss.pre.material import Material
+from framesss.pre.section import Section
+
+
+@pytest.fixture(scope="session")
+def make_dummy_section() -> Callable[[float, float], Section]:
+    """
+    Return a factory of sections whose only relevant properties are the bending stiffness terms.
+
+    The elastic modulus and the second moment of inertia are passed explicitly by the test module,
+    so the section always matches the constants used in its analytical solutions.
+    """
+
+    def make(elastic_modulus: float, inertia_y: float) -> Section:
+        material = Material("foo", elastic_modulus, 1, 1, 1)
+        return Section("bar", 1, 1, 1, 1, inertia_y, 1, 1, 1, material)
+
+    return make
@@ -8,12 +8,9 @@ The test examples were taken from the following publication:
 """
 
 import numpy as np
-from numpy.testing import assert_almost_equal
-from numpy.testing import assert_array_almost_equal
+import pytest
 
 from framesss.fea.models.frame_xz import FrameXZModel
-from framesss.pre.material import Material
-from framesss.pre.section import Section
 from framesss.solvers.linear_static import LinearStaticSolver
 
 P = 1000.0  # Force magnitude
@@ -37,1322 +34,974 @@ a2 = 0.3 * L
 b2 = 0.3 * L
 c2 = 0.4 * L
 
-DUMMY_MAT = Material("foo", E, 1, 1, 1)
-DUMMY_SEC = Section("bar", 1, 1, 1, 1, I, 1, 1, 1, DUMMY_MAT)
 
+# Support fixities
+BC_FREE = ("free", "free", "free", "free", "free", "free")
+BC_PIN = ("fixed", "free", "fixed", "free", "free", "free")
+BC_ROLLER = ("free", "free", "fixed", "free", "free", "free")
+BC_FIXED = ("fixed", "free", "fixed", "free", "fixed", "free")
 
-def test_figure_1() -> None:
-    """[1, Fig. 1] Simple beam - Uniformly Distributed Load."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
+# Load components
+LOAD_UNIFORM = (0, 0, -w, 0, 0, -w)
+LOAD_TRIANGULAR_RISING = (0, 0, 0, 0, 0, -w)
+LOAD_TRIANGULAR_FALLING = (0, 0, -w, 0, 0, 0)
+LOAD_POINT = (0, 0, -P, 0, 0, 0)
+LOAD_UNIFORM_1 = (0, 0, -w1, 0, 0, -w1)
+LOAD_UNIFORM_2 = (0, 0, -w2, 0, 0, -w2)
+LOAD_POINT_1 = (0, 0, -P1, 0, 0, 0)
+LOAD_POINT_2 = (0, 0, -P2, 0, 0, 0)
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load([0, 0, -w, 0, 0, -w], load_case)
 
-    solver = LinearStaticSolver(model)
-    solver.solve()
+def interval_slices(x, *bounds):
+    """
+    Split the sorted sampling points ``x`` into contiguous intervals at ``bounds``.
 
-    x = member.x_local
+    All bounds are located by one binary search. Points lying at a bound belong to the interval
+    on its left; the values at load discontinuities are set separately.
+    """
+    edges = [None, *np.searchsorted(x, bounds, side="right").tolist(), None]
+    return [slice(start, stop) for start, stop in zip(edges[:-1], edges[1:])]
 
-    # Expected results
-    R1 = w * L / 2
-    R2 = w * L / 2
 
-    shear_forces_z = w * (L / 2 - x)
-    bending_moments_y = w * x / 2 * (L - x)
+def discontinuity_index(x, a):
+    """
+    Return the index of the first of the two sampling points placed at the discontinuity ``a``.
 
-    # Deflection in [1] is considered positive in negative z-direction
-    translations_z = -w * x / (24 * E * I) * (L**3 - 2 * L * x**2 + x**3)
+    ``x`` is sorted, so a binary search replaces a full :func:`numpy.isclose` scan. The second
+    point of the pair immediately follows the returned index.
+    """
+    return np.searchsorted(x, a - 1e-8)
 
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, w * L**2 / 8])
 
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
+def min_max(a, b):
+    """Return the two extremes ``a`` and ``b`` as a sorted ``[min, max]`` array."""
+    return np.array([a, b]) if a <= b else np.array([b, a])
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
+# Expected reactions: key -> (index of node, result name)
+REACTIONS = {
+    "R1": (0, "reaction_force_z"),
+    "R2": (1, "reaction_force_z"),
+    "M2": (1, "reaction_moment_y"),
+}
 
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
+# Absolute tolerance for reactions, i.e. equality up to 7 decimals
+REACTION_TOLERANCE = 1.5e-7
 
 
-def test_figure_2() -> None:
-    """[1, Fig. 2] Simple beam - Uniform Load Partially Distributed."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
+def assert_close(actual, desired):
+    """
+    Assert that two arrays are equal up to 6 decimals.
 
-    a, b, c = a2, b2, c2
+    Same criterion as :func:`numpy.testing.assert_array_almost_equal`
+    (``abs(desired - actual) < 1.5e-6``), without building its error report when the arrays match.
+    """
+    assert (
+        actual.shape == desired.shape
+    ), f"shapes {actual.shape} and {desired.shape} differ"
+    assert np.allclose(
+        actual, desired, rtol=0, atol=1.5e-6
+    ), "arrays are not almost equal"
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load(
-        [0, 0, -w, 0, 0, -w],
-        load_case,
-        x_start=a,
-        x_end=a + b,
-        coordinate_definition="absolute",
-    )
 
-    solver.solve()
+def assert_beam_results(member, nodes, load_case, expected):
+    """
+    Assert the results of ``member`` and its end ``nodes`` in ``load_case``.
 
-    x = member.x_local
+    ``expected`` maps the :data:`REACTIONS` keys to reactions and any other key to the name of a
+    member result, e.g. ``"shear_forces_z"``. Missing keys are not checked.
+    """
+    for key, value in expected.items():
+        if key in REACTIONS:
+            index, name = REACTIONS[key]
+            reaction = getattr(nodes[index].results, name)[load_case]
+            assert reaction == pytest.approx(value, rel=0, abs=REACTION_TOLERANCE)
+        else:
+            assert_close(getattr(member.results, key)[load_case], value)
 
-    # Expected results
-    R1 = w * b / (2 * L) * (2 * c + b)
-    R2 = w * b / (2 * L) * (2 * a + b)
 
-    # Expected internal forces
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
+def build_beam(section, fixity_1, fixity_2):
+    """Return a single span beam model, its member and both end nodes."""
+    model = FrameXZModel()
+    node_1 = model.add_node("N1", [], fixity_1)
+    node_2 = model.add_node("N2", [L], fixity_2)
+    member = model.add_member("M1", "navier", [node_1, node_2], section)
+    return model, member, node_1, node_2
 
-    interval = x <= a
-    shear_forces_z[interval] = R1
-    bending_moments_y[interval] = R1 * x[interval]
 
-    interval = (x > a) * (x < a + b)
-    shear_forces_z[interval] = R1 - w * (x[interval] - a)
-    bending_moments_y[interval] = R1 * x[interval] - w / 2 * (x[interval] - a) ** 2
+@pytest.fixture(scope="module")
+def dummy_section(make_dummy_section):
+    """Return a section matching the elastic modulus and inertia of this module."""
+    return make_dummy_section(E, I)
 
-    interval = x >= a + b
-    shear_forces_z[interval] = -R2
-    bending_moments_y[interval] = R2 * (L - x[interval])
 
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, R1 * (a + R1 / (2 * w))])
+@pytest.fixture
+def simple_beam(dummy_section):
+    """Return a fresh simple beam model with a single, empty load case."""
+    model, member, node_1, node_2 = build_beam(dummy_section, BC_PIN, BC_ROLLER)
+    load_case = model.add_load_case("LC1")
+    return model, member, node_1, node_2, load_case
 
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
+def expected_figure_1(x):
+    """[1, Fig. 1] Simple beam - Uniformly Distributed Load."""
+    R1 = w * L / 2
+    R2 = w * L / 2
 
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
+    x2 = x * x
+    x3 = x2 * x
 
+    shear_forces_z = w * (L / 2 - x)
+    bending_moments_y = w * x / 2 * (L - x)
 
-def test_figure_3() -> None:
-    """[1, Fig. 3] Simple beam - Uniform Load Partially Distributed at One End."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
+    # Deflection in [1] is considered positive in negative z-direction
+    translations_z = -w * x / (24 * E * I) * (L**3 - 2 * L * x2 + x3)
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, w * L**2 / 8),
+    }
 
-    a = a1
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load(
-        [0, 0, -w, 0, 0, -w],
-        load_case,
-        x_start=0,
-        x_end=a,
-        coordinate_definition="absolute",
-    )
+def expected_figure_2(x):
+    """[1, Fig. 2] Simple beam - Uniform Load Partially Distributed."""
+    a, b, c = a2, b2, c2
 
-    solver.solve()
+    R1 = w * b / (2 * L) * (2 * c + b)
+    R2 = w * b / (2 * L) * (2 * a + b)
 
-    x = member.x_local
+    # Expected internal forces
+    left, middle, right = interval_slices(x, a, a + b)
+
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+
+    xi = x[left]
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = R1 * xi
+
+    xi = x[middle]
+    shear_forces_z[middle] = R1 - w * (xi - a)
+    bending_moments_y[middle] = R1 * xi - w / 2 * (xi - a) ** 2
+
+    xi = x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = R2 * (L - xi)
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, R1 * (a + R1 / (2 * w))),
+    }
+
+
+def expected_figure_3(x):
+    """[1, Fig. 3] Simple beam - Uniform Load Partially Distributed at One End."""
+    a = a1
 
-    # Expected results
     R1 = w * a / (2 * L) * (2 * L - a)
     R2 = w * a**2 / (2 * L)
 
     # Expected internal forces
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= a
-    shear_forces_z[interval] = R1 - w * x[interval]
-    bending_moments_y[interval] = R1 * x[interval] - w * x[interval] ** 2 / 2
-    translations_z[interval] = (
-        -w
-        * x[interval]
-        / (24 * E * I * L)
-        * (
-            a**2 * (2 * L - a) ** 2
-            - 2 * a * x[interval] ** 2 * (2 * L - a)
-            + L * x[interval] ** 3
-        )
-    )
+    left, right = interval_slices(x, a)
+
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
 
-    interval = x > a
-    shear_forces_z[interval] = np.full(x[interval].shape, -R2)
-    bending_moments_y[interval] = R2 * (L - x[interval])
-    translations_z[interval] = (
+    xi = x[left]
+    shear_forces_z[left] = R1 - w * xi
+    bending_moments_y[left] = R1 * xi - w * xi**2 / 2
+    translations_z[left] = (
         -w
-        * a**2
-        * (L - x[interval])
+        * xi
         / (24 * E * I * L)
-        * (4 * x[interval] * L - 2 * x[interval] ** 2 - a**2)
+        * (a**2 * (2 * L - a) ** 2 - 2 * a * xi**2 * (2 * L - a) + L * xi**3)
     )
 
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, R1**2 / (2 * w)])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
+    xi = x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = R2 * (L - xi)
+    translations_z[right] = (
+        -w * a**2 * (L - xi) / (24 * E * I * L) * (4 * xi * L - 2 * xi**2 - a**2)
     )
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, R1**2 / (2 * w)),
+    }
 
 
-def test_figure_4() -> None:
+def expected_figure_4(x):
     """[1, Fig. 4] Simple beam - Uniform Load Partially Distributed at Each End."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
     a, b, c = a2, b2, c2
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load(
-        [0, 0, -w1, 0, 0, -w1], load_case, x_end=a, coordinate_definition="absolute"
-    )
-    member.add_distributed_load(
-        [0, 0, -w2, 0, 0, -w2],
-        load_case,
-        x_start=a + b,
-        x_end=L,
-        coordinate_definition="absolute",
-    )
-
-    solver.solve()
-
-    x = member.x_local
-
-    # Expected results
     R1 = (w1 * a * (2 * L - a) + w2 * c**2) / (2 * L)
     R2 = (w2 * c * (2 * L - c) + w1 * a**2) / (2 * L)
 
     # Expected internal forces
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
+    left, middle, right = interval_slices(x, a, a + b)
 
-    interval = x <= a
-    shear_forces_z[interval] = R1 - w1 * x[interval]
-    bending_moments_y[interval] = R1 * x[interval] - w1 * x[interval] ** 2 / 2
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
 
-    interval = (x > a) * (x < a + b)
-    shear_forces_z[interval] = np.full(x[interval].shape, R1 - w1 * a)
-    bending_moments_y[interval] = R1 * x[interval] - w1 * a * (2 * x[interval] - a) / 2
+    xi = x[left]
+    shear_forces_z[left] = R1 - w1 * xi
+    bending_moments_y[left] = R1 * xi - w1 * xi**2 / 2
 
-    interval = x >= a + b
-    shear_forces_z[interval] = -R2 + w2 * (L - x[interval])
-    bending_moments_y[interval] = (
-        R2 * (L - x[interval]) - w2 * (L - x[interval]) ** 2 / 2
-    )
+    xi = x[middle]
+    shear_forces_z[middle] = R1 - w1 * a
+    bending_moments_y[middle] = R1 * xi - w1 * a * (2 * xi - a) / 2
+
+    xi = x[right]
+    shear_forces_z[right] = -R2 + w2 * (L - xi)
+    bending_moments_y[right] = R2 * (L - xi) - w2 * (L - xi) ** 2 / 2
 
-    min_max_shear = np.sort([R1, -R2])
     if abs(R1) < abs(w1 * a):
-        min_max_moment = np.sort([0, R1**2 / (2 * w1)])
+        min_max_moment = min_max(0.0, R1**2 / (2 * w1))
     else:
-        min_max_moment = np.sort([0, R2**2 / (2 * w2)])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
+        min_max_moment = min_max(0.0, R2**2 / (2 * w2))
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max_moment,
+    }
 
 
-def test_figure_5() -> None:
+def expected_figure_5(x):
     """[1, Fig. 5] Simple beam - Load Increasing Uniformly to One End."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load([0, 0, 0, 0, 0, -w], load_case)
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
     W = w * L / 2
 
-    # Expected results
-    R1 = W / 3
-    R2 = 2 * W / 3
-
-    shear_forces_z = W / 3 - W * x**2 / L**2
-    bending_moments_y = W * x * (L**2 - x**2) / (3 * L**2)
-
-    # Deflection in [1] is considered positive in negative z-direction
-    translations_z = (
-        -W * x * (3 * x**4 - 10 * L**2 * x**2 + 7 * L**4) / (180 * E * I * L**2)
-    )
-
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, 2 * W * L / (9 * np.sqrt(3))])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
-
-
-def test_figure_6() -> None:
-    """[1, Fig. 6] Simple beam - Load Increasing Uniformly to Center."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load([0, 0, 0, 0, 0, -w], load_case, x_end=0.5)
-    member.add_distributed_load([0, 0, -w, 0, 0, 0], load_case, x_start=0.5)
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
-    W = w * L / 2
-
-    # Expected results
-    R1 = W / 2
-    R2 = W / 2
-
-    # Expected internal forces
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= L / 2
-    shear_forces_z[interval] = W * (L**2 - 4 * x[interval] ** 2) / (2 * L**2)
-    bending_moments_y[interval] = (
-        W * x[interval] * (1 / 2 - 2 * x[interval] ** 2 / (3 * L**2))
-    )
-    translations_z[interval] = (
-        -W * x[interval] * (5 * L**2 - 4 * x[interval] ** 2) ** 2 / (480 * E * I * L**2)
-    )
-
-    interval = x > L / 2
-    shear_forces_z[interval] = -W * (L**2 - 4 * (L - x[interval]) ** 2) / (2 * L**2)
-    bending_moments_y[interval] = (
-        W * (L - x[interval]) * (1 / 2 - 2 * (L - x[interval]) ** 2 / (3 * L**2))
-    )
-    translations_z[interval] = (
-        -W
-        * (L - x[interval])
-        * (5 * L**2 - 4 * (L - x[interval]) ** 2) ** 2
-        / (480 * E * I * L**2)
-    )
-
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, W * L / 6])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
-
-
-def test_figure_7() -> None:
-    """[1, Fig. 7] Simple beam - Concentrated Load at Center."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load([0, 0, -P, 0, 0, 0], load_case, x=0.5)
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
-    # Expected results
-    R1 = P / 2
-    R2 = P / 2
-
-    # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= L / 2
-    shear_forces_z[interval] = np.full(x[interval].shape, R1)
-    bending_moments_y[interval] = P * x[interval] / 2
-    translations_z[interval] = (
-        -P * x[interval] * (3 * L**2 - 4 * x[interval] ** 2) / (48 * E * I)
-    )
-
-    interval = x > L / 2
-    shear_forces_z[interval] = np.full(x[interval].shape, -R2)
-    bending_moments_y[interval] = P * (L - x[interval]) / 2
-    translations_z[interval] = (
-        -P * (L - x[interval]) * (3 * L**2 - 4 * (L - x[interval]) ** 2) / (48 * E * I)
-    )
-
-    # Handle the mid-values of shear force
-    interval = np.where(np.isclose(x, L / 2))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = -R2
-
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, P * L / 4])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
-
-
-def test_figure_8() -> None:
-    """[1, Fig. 8] Simple beam - Concentrated Load at Any Point."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
-    a, b = a1, b1
-
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load(
-        [0, 0, -P, 0, 0, 0], load_case, x=a, coordinate_definition="absolute"
-    )
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
-    # Expected results
-    R1 = P * b / L
-    R2 = P * a / L
-
-    # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= a
-    shear_forces_z[interval] = np.full(x[interval].shape, R1)
-    bending_moments_y[interval] = R1 * x[interval]
-    translations_z[interval] = (
-        -P * b * x[interval] * (L**2 - b**2 - x[interval] ** 2) / (6 * E * I * L)
-    )
-
-    interval = x > a
-    shear_forces_z[interval] = np.full(x[interval].shape, -R2)
-    bending_moments_y[interval] = R2 * (L - x[interval])
-    translations_z[interval] = (
-        -P
-        * a
-        * (L - x[interval])
-        * (2 * L * x[interval] - x[interval] ** 2 - a**2)
-        / (6 * E * I * L)
-    )
-
-    # Handle the mid-values of shear force
-    interval = np.where(np.isclose(x, a))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = -R2
-
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, P * a * b / L])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
-
-
-def test_figure_9() -> None:
-    """[1, Fig. 9] Simple beam - Two Equal Concentrated Loads Symetrically Placed."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
-    a = 0.3
-
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load(
-        [0, 0, -P, 0, 0, 0], load_case, x=a, coordinate_definition="absolute"
-    )
-    member.add_point_load(
-        [0, 0, -P, 0, 0, 0], load_case, x=L - a, coordinate_definition="absolute"
-    )
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
-    # Expected results
-    R1 = P
-    R2 = P
-
-    # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= a
-    shear_forces_z[interval] = np.full(x[interval].shape, R1)
-    bending_moments_y[interval] = R1 * x[interval]
-    translations_z[interval] = (
-        -P * x[interval] * (3 * L * a - 3 * a**2 - x[interval] ** 2) / (6 * E * I)
-    )
-
-    interval = np.where(np.isclose(x, a))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = 0
-
-    interval = (x > a) * (x < L - a)
-    shear_forces_z[interval] = np.full(x[interval].shape, 0.0)
-    bending_moments_y[interval] = np.full(x[interval].shape, P * a)
-    translations_z[interval] = (
-        -P * a * (3 * L * x[interval] - 3 * x[interval] ** 2 - a**2) / (6 * E * I)
-    )
-
-    interval = x >= L - a
-    shear_forces_z[interval] = np.full(x[interval].shape, -R2)
-    bending_moments_y[interval] = R2 * (L - x[interval])
-    translations_z[interval] = (
-        -P
-        * (L - x[interval])
-        * (3 * L * a - 3 * a**2 - (L - x[interval]) ** 2)
-        / (6 * E * I)
-    )
-
-    interval = np.where(np.isclose(x, L - a))[0]
-    shear_forces_z[interval[0]] = 0
-    shear_forces_z[interval[1]] = -R2
-
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([0, P * a])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
-
-
-def test_figure_10() -> None:
-    """[1, Fig. 10] Simple Beam - Two Equal Concentrated Loads Unsymmetrically Placed."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
-    a, b = a2, b2
-
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load(
-        [0, 0, -P, 0, 0, 0], load_case, x=a, coordinate_definition="absolute"
-    )
-    member.add_point_load(
-        [0, 0, -P, 0, 0, 0], load_case, x=L - b, coordinate_definition="absolute"
-    )
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
-    # Expected results
-    R1 = P * (L - a + b) / L
-    R2 = P * (L - b + a) / L
-
-    # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-
-    interval = x <= a
-    shear_forces_z[interval] = np.full(x[interval].shape, R1)
-    bending_moments_y[interval] = R1 * x[interval]
-
-    interval = (x >= a) * (x <= L - b)
-    shear_forces_z[interval] = np.full(x[interval].shape, R1 - P)
-    bending_moments_y[interval] = R1 * x[interval] - P * (x[interval] - a)
-
-    interval = x >= L - b
-    shear_forces_z[interval] = np.full(x[interval].shape, -R2)
-    bending_moments_y[interval] = R2 * (L - x[interval])
-
-    interval = np.where(np.isclose(x, a))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = R1 - P
-
-    interval = np.where(np.isclose(x, L - b))[0]
-    shear_forces_z[interval[0]] = R1 - P
-    shear_forces_z[interval[1]] = -R2
-
-    min_max_shear = np.sort([R1, -R2])
-    if a > b:
-        min_max_moment = np.sort([0, R1 * a])
-    else:
-        min_max_moment = np.sort([0, R2 * b])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
-
-
-def test_figure_11() -> None:
-    """[1, Fig. 11] Simple Beam - Two Unequal Concentrated Loads Unsymmetrically Placed."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
-    a, b = a2, b2
-
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load(
-        [0, 0, -P1, 0, 0, 0], load_case, x=a, coordinate_definition="absolute"
-    )
-    member.add_point_load(
-        [0, 0, -P2, 0, 0, 0], load_case, x=L - b, coordinate_definition="absolute"
-    )
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
-    # Expected results
-    R1 = (P1 * (L - a) + P2 * b) / L
-    R2 = (P1 * a + P2 * (L - b)) / L
-
-    # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-
-    interval = x <= a
-    shear_forces_z[interval] = np.full(x[interval].shape, R1)
-    bending_moments_y[interval] = R1 * x[interval]
-
-    interval = (x >= a) * (x <= L - b)
-    shear_forces_z[interval] = np.full(x[interval].shape, R1 - P1)
-    bending_moments_y[interval] = R1 * x[interval] - P1 * (x[interval] - a)
-
-    interval = x >= L - b
-    shear_forces_z[interval] = np.full(x[interval].shape, -R2)
-    bending_moments_y[interval] = R2 * (L - x[interval])
-
-    interval = np.where(np.isclose(x, a))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = R1 - P1
-
-    interval = np.where(np.isclose(x, L - b))[0]
-    shear_forces_z[interval[0]] = R1 - P1
-    shear_forces_z[interval[1]] = -R2
-
-    min_max_shear = np.sort([R1, -R2])
-    if abs(R1) < abs(P1):
-        min_max_moment = np.sort([0, R1 * a])
-    else:
-        min_max_moment = np.sort([0, R2 * b])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
-
-
-def test_figure_11_combinations() -> None:
-    """[1, Fig. 11] Simple Beam - Two Unequal Concentrated Loads Unsymmetrically Placed."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    lc1 = model.add_load_case("LC1")
-    lc2 = model.add_load_case("LC2")
-
-    combination = {
-        lc1: 1.0,
-        lc2: 2.0,
-    }
-
-    comb = model.add_load_case_combination("CO1", combination)
-
-    solver = LinearStaticSolver(model)
-
-    a, b = a2, b2
+    R1 = W / 3
+    R2 = 2 * W / 3
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load(
-        [0, 0, -P1, 0, 0, 0], lc1, x=a, coordinate_definition="absolute"
-    )
-    member.add_point_load(
-        [0, 0, -P2 / 2, 0, 0, 0], lc2, x=L - b, coordinate_definition="absolute"
-    )
+    x2 = x * x
 
-    solver = LinearStaticSolver(model)
-    solver.solve()
+    shear_forces_z = W / 3 - W * x2 / L**2
+    bending_moments_y = W * x * (L**2 - x2) / (3 * L**2)
 
-    x = member.x_local
+    # Deflection in [1] is considered positive in negative z-direction
+    translations_z = (
+        -W * x * (3 * x2 * x2 - 10 * L**2 * x2 + 7 * L**4) / (180 * E * I * L**2)
+    )
 
-    # Expected results
-    R1 = (P1 * (L - a) + P2 * b) / L
-    R2 = (P1 * a + P2 * (L - b)) / L
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, 2 * W * L / (9 * np.sqrt(3))),
+    }
 
-    # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
 
-    interval = x <= a
-    shear_forces_z[interval] = np.full(x[interval].shape, R1)
-    bending_moments_y[interval] = R1 * x[interval]
+def expected_figure_6(x):
+    """[1, Fig. 6] Simple beam - Load Increasing Uniformly to Center."""
+    W = w * L / 2
 
-    interval = (x >= a) * (x <= L - b)
-    shear_forces_z[interval] = np.full(x[interval].shape, R1 - P1)
-    bending_moments_y[interval] = R1 * x[interval] - P1 * (x[interval] - a)
+    R1 = W / 2
+    R2 = W / 2
 
-    interval = x >= L - b
-    shear_forces_z[interval] = np.full(x[interval].shape, -R2)
-    bending_moments_y[interval] = R2 * (L - x[interval])
+    # Expected internal forces
+    left, right = interval_slices(x, L / 2)
+
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
+
+    xi = x[left]
+    shear_forces_z[left] = W * (L**2 - 4 * xi**2) / (2 * L**2)
+    bending_moments_y[left] = W * xi * (1 / 2 - 2 * xi**2 / (3 * L**2))
+    translations_z[left] = -W * xi * (5 * L**2 - 4 * xi**2) ** 2 / (480 * E * I * L**2)
+
+    # Symmetric branch, xi is measured from the right support
+    xi = L - x[right]
+    shear_forces_z[right] = -W * (L**2 - 4 * xi**2) / (2 * L**2)
+    bending_moments_y[right] = W * xi * (1 / 2 - 2 * xi**2 / (3 * L**2))
+    translations_z[right] = -W * xi * (5 * L**2 - 4 * xi**2) ** 2 / (480 * E * I * L**2)
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, W * L / 6),
+    }
 
-    interval = np.where(np.isclose(x, a))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = R1 - P1
 
-    interval = np.where(np.isclose(x, L - b))[0]
-    shear_forces_z[interval[0]] = R1 - P1
-    shear_forces_z[interval[1]] = -R2
+def expected_figure_7(x):
+    """[1, Fig. 7] Simple beam - Concentrated Load at Center."""
+    R1 = P / 2
+    R2 = P / 2
 
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[comb], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[comb], R2)
+    # Expected internal forces & displacements
+    left, right = interval_slices(x, L / 2)
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[comb], shear_forces_z)
-    assert_array_almost_equal(member.results.bending_moments_y[comb], bending_moments_y)
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
 
+    xi = x[left]
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = P * xi / 2
+    translations_z[left] = -P * xi * (3 * L**2 - 4 * xi**2) / (48 * E * I)
 
-def test_figure_12() -> None:
-    """[1, Fig. 12] Cantilever Beam - Uniformly Distributed Load."""
-    model = FrameXZModel()
-    node_1 = model.add_node("N1", [], ["free", "free", "free", "free", "free", "free"])
-    node_2 = model.add_node(
-        "N2", [L], ["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
+    # Symmetric branch, xi is measured from the right support
+    xi = L - x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = P * xi / 2
+    translations_z[right] = -P * xi * (3 * L**2 - 4 * xi**2) / (48 * E * I)
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load([0, 0, -w, 0, 0, -w], load_case)
+    # Handle the mid-values of shear force
+    i = discontinuity_index(x, L / 2)
+    shear_forces_z[i] = R1
+    shear_forces_z[i + 1] = -R2
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, P * L / 4),
+    }
 
-    solver = LinearStaticSolver(model)
-    solver.solve()
 
-    x = member.x_local
+def expected_figure_8(x):
+    """[1, Fig. 8] Simple beam - Concentrated Load at Any Point."""
+    a, b = a1, b1
 
-    # Expected results
-    R = w * L
-    M = w * L**2 / 2
+    R1 = P * b / L
+    R2 = P * a / L
 
     # Expected internal forces & displacements
-    shear_forces_z = -w * x
-    bending_moments_y = -w * x**2 / 2
-    translations_z = -w * (x**4 - 4 * L**3 * x + 3 * L**4) / (24 * E * I)
+    left, right = interval_slices(x, a)
 
-    min_max_shear = np.sort([0, -R])
-    min_max_moment = np.sort([0, -M])
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
 
-    # Reactions
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R)
-    assert_almost_equal(node_2.results.reaction_moment_y[load_case], M)
+    xi = x[left]
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = R1 * xi
+    translations_z[left] = -P * b * xi * (L**2 - b**2 - xi**2) / (6 * E * I * L)
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
+    xi = x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = R2 * (L - xi)
+    translations_z[right] = (
+        -P * a * (L - xi) * (2 * L * xi - xi**2 - a**2) / (6 * E * I * L)
     )
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
+    # Handle the mid-values of shear force
+    i = discontinuity_index(x, a)
+    shear_forces_z[i] = R1
+    shear_forces_z[i + 1] = -R2
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, P * a * b / L),
+    }
 
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
 
+def expected_figure_9(x):
+    """[1, Fig. 9] Simple beam - Two Equal Concentrated Loads Symetrically Placed."""
+    a = 0.3
 
-def test_figure_13() -> None:
-    """[1, Fig. 13] Cantilever Beam - Concentrated Load at Free End."""
-    model = FrameXZModel()
-    node_1 = model.add_node("N1", [], ["free", "free", "free", "free", "free", "free"])
-    node_2 = model.add_node(
-        "N2", [L], ["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
+    R1 = P
+    R2 = P
 
-    # Load in [1] is applied in the negative z-direction
-    node_1.add_nodal_load([0, 0, -P, 0, 0, 0], load_case)
+    # Expected internal forces & displacements
+    left, middle, right = interval_slices(x, a, L - a)
+
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
+
+    xi = x[left]
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = R1 * xi
+    translations_z[left] = -P * xi * (3 * L * a - 3 * a**2 - xi**2) / (6 * E * I)
+
+    xi = x[middle]
+    shear_forces_z[middle] = 0.0
+    bending_moments_y[middle] = P * a
+    translations_z[middle] = -P * a * (3 * L * xi - 3 * xi**2 - a**2) / (6 * E * I)
+
+    # Symmetric branch, xi is measured from the right support
+    xi = L - x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = R2 * xi
+    translations_z[right] = -P * xi * (3 * L * a - 3 * a**2 - xi**2) / (6 * E * I)
+
+    # Handle the values of shear force under the loads
+    i = discontinuity_index(x, a)
+    shear_forces_z[i] = R1
+    shear_forces_z[i + 1] = 0
+
+    i = discontinuity_index(x, L - a)
+    shear_forces_z[i] = 0
+    shear_forces_z[i + 1] = -R2
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(0.0, P * a),
+    }
 
-    solver = LinearStaticSolver(model)
-    solver.solve()
 
-    x = member.x_local
+def expected_figure_10(x):
+    """[1, Fig. 10] Simple Beam - Two Equal Concentrated Loads Unsymmetrically Placed."""
+    a, b = a2, b2
 
-    # Expected results
-    R = P
-    M = P * L
+    R1 = P * (L - a + b) / L
+    R2 = P * (L - b + a) / L
 
     # Expected internal forces & displacements
-    shear_forces_z = np.full(x.shape, -R)
-    bending_moments_y = -P * x
-    translations_z = -P * (2 * L**3 - 3 * L**2 * x + x**3) / (6 * E * I)
+    left, middle, right = interval_slices(x, a, L - b)
 
-    min_max_shear = np.sort([-R, -R])
-    min_max_moment = np.sort([0, -M])
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
 
-    # Reactions
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R)
-    assert_almost_equal(node_2.results.reaction_moment_y[load_case], M)
+    xi = x[left]
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = R1 * xi
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
+    xi = x[middle]
+    shear_forces_z[middle] = R1 - P
+    bending_moments_y[middle] = R1 * xi - P * (xi - a)
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
+    xi = x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = R2 * (L - xi)
 
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
+    # Handle the values of shear force under the loads
+    i = discontinuity_index(x, a)
+    shear_forces_z[i] = R1
+    shear_forces_z[i + 1] = R1 - P
 
+    i = discontinuity_index(x, L - b)
+    shear_forces_z[i] = R1 - P
+    shear_forces_z[i + 1] = -R2
 
-def test_figure_14() -> None:
-    """[1, Fig. 14] Cantilever Beam - Concentrated Load at Any Point."""
-    model = FrameXZModel()
-    node_1 = model.add_node("N1", [], ["free", "free", "free", "free", "free", "free"])
-    node_2 = model.add_node(
-        "N2", [L], ["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
+    if a > b:
+        min_max_moment = min_max(0.0, R1 * a)
+    else:
+        min_max_moment = min_max(0.0, R2 * b)
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max_moment,
+    }
 
-    a, b = a1, b1
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load(
-        [0, 0, -P, 0, 0, 0], load_case, x=a, coordinate_definition="absolute"
-    )
+def expected_figure_11(x):
+    """[1, Fig. 11] Simple Beam - Two Unequal Concentrated Loads Unsymmetrically Placed."""
+    a, b = a2, b2
 
-    solver = LinearStaticSolver(model)
-    solver.solve()
+    R1 = (P1 * (L - a) + P2 * b) / L
+    R2 = (P1 * a + P2 * (L - b)) / L
 
-    x = member.x_local
+    # Expected internal forces & displacements
+    left, middle, right = interval_slices(x, a, L - b)
 
-    # Expected results
-    R = P
-    M = P * b
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
 
-    # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= a
-    shear_forces_z[interval] = np.full(x[interval].shape, 0)
-    bending_moments_y[interval] = np.full(x[interval].shape, 0)
-    translations_z[interval] = -P * b**2 * (3 * L - 3 * x[interval] - b) / (6 * E * I)
-
-    interval = x > a
-    shear_forces_z[interval] = np.full(x[interval].shape, -R)
-    bending_moments_y[interval] = -P * (x[interval] - a)
-    translations_z[interval] = (
-        -P * (L - x[interval]) ** 2 * (3 * b - L + x[interval]) / (6 * E * I)
-    )
+    xi = x[left]
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = R1 * xi
 
-    interval = np.where(np.isclose(x, a))[0]
-    shear_forces_z[interval[0]] = 0
-    shear_forces_z[interval[1]] = -R
+    xi = x[middle]
+    shear_forces_z[middle] = R1 - P1
+    bending_moments_y[middle] = R1 * xi - P1 * (xi - a)
 
-    min_max_shear = np.sort([0, -R])
-    min_max_moment = np.sort([0, -M])
+    xi = x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = R2 * (L - xi)
 
-    # Reactions
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R)
-    assert_almost_equal(node_2.results.reaction_moment_y[load_case], M)
+    # Handle the values of shear force under the loads
+    i = discontinuity_index(x, a)
+    shear_forces_z[i] = R1
+    shear_forces_z[i + 1] = R1 - P1
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
+    i = discontinuity_index(x, L - b)
+    shear_forces_z[i] = R1 - P1
+    shear_forces_z[i + 1] = -R2
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
+    if abs(R1) < abs(P1):
+        min_max_moment = min_max(0.0, R1 * a)
+    else:
+        min_max_moment = min_max(0.0, R2 * b)
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max_moment,
+    }
 
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
 
+# Simple beam cases: (id, loads, expected results).
+# Each load is a (kind, components, kwargs) tuple passed to ``member.add_<kind>_load``.
+# Loads in [1] are applied in the negative z-direction.
+SIMPLE_BEAM_CASES = [
+    (
+        "figure_1",
+        [("distributed", LOAD_UNIFORM, {})],
+        expected_figure_1,
+    ),
+    (
+        "figure_2",
+        [
+            (
+                "distributed",
+                LOAD_UNIFORM,
+                {
+                    "x_start": a2,
+                    "x_end": a2 + b2,
+                    "coordinate_definition": "absolute",
+                },
+            )
+        ],
+        expected_figure_2,
+    ),
+    (
+        "figure_3",
+        [
+            (
+                "distributed",
+                LOAD_UNIFORM,
+                {"x_start": 0, "x_end": a1, "coordinate_definition": "absolute"},
+            )
+        ],
+        expected_figure_3,
+    ),
+    (
+        "figure_4",
+        [
+            (
+                "distributed",
+                LOAD_UNIFORM_1,
+                {"x_end": a2, "coordinate_definition": "absolute"},
+            ),
+            (
+                "distributed",
+                LOAD_UNIFORM_2,
+                {
+                    "x_start": a2 + b2,
+                    "x_end": L,
+                    "coordinate_definition": "absolute",
+                },
+            ),
+        ],
+        expected_figure_4,
+    ),
+    (
+        "figure_5",
+        [("distributed", LOAD_TRIANGULAR_RISING, {})],
+        expected_figure_5,
+    ),
+    (
+        "figure_6",
+        [
+            ("distributed", LOAD_TRIANGULAR_RISING, {"x_end": 0.5}),
+            ("distributed", LOAD_TRIANGULAR_FALLING, {"x_start": 0.5}),
+        ],
+        expected_figure_6,
+    ),
+    (
+        "figure_7",
+        [("point", LOAD_POINT, {"x": 0.5})],
+        expected_figure_7,
+    ),
+    (
+        "figure_8",
+        [
+            (
+                "point",
+                LOAD_POINT,
+                {"x": a1, "coordinate_definition": "absolute"},
+            )
+        ],
+        expected_figure_8,
+    ),
+    (
+        "figure_9",
+        [
+            (
+                "point",
+                LOAD_POINT,
+                {"x": 0.3, "coordinate_definition": "absolute"},
+            ),
+            (
+                "point",
+                LOAD_POINT,
+                {"x": L - 0.3, "coordinate_definition": "absolute"},
+            ),
+        ],
+        expected_figure_9,
+    ),
+    (
+        "figure_10",
+        [
+            (
+                "point",
+                LOAD_POINT,
+                {"x": a2, "coordinate_definition": "absolute"},
+            ),
+            (
+                "point",
+                LOAD_POINT,
+                {"x": L - b2, "coordinate_definition": "absolute"},
+            ),
+        ],
+        expected_figure_10,
+    ),
+    (
+        "figure_11",
+        [
+            (
+                "point",
+                LOAD_POINT_1,
+                {"x": a2, "coordinate_definition": "absolute"},
+            ),
+            (
+                "point",
+                LOAD_POINT_2,
+                {"x": L - b2, "coordinate_definition": "absolute"},
+            ),
+        ],
+        expected_figure_11,
+    ),
+]
+
+
+def expected_figure_12(x):
+    """[1, Fig. 12] Cantilever Beam - Uniformly Distributed Load."""
+    R = w * L
+    M = w * L**2 / 2
 
-def test_figure_15() -> None:
-    """[1, Fig. 15] Beam Fixed at One End, Supported at Other - Uniformly Distributed Load."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
+    x2 = x * x
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load([0, 0, -w, 0, 0, -w], load_case)
+    return {
+        "R2": R,
+        "M2": M,
+        "shear_forces_z": -w * x,
+        "bending_moments_y": -w * x2 / 2,
+        "translations_z": -w * (x2 * x2 - 4 * L**3 * x + 3 * L**4) / (24 * E * I),
+        "min_max_shear_forces_z": min_max(0.0, -R),
+        "min_max_bending_moments_y": min_max(0.0, -M),
+    }
 
-    solver = LinearStaticSolver(model)
-    solver.solve()
 
-    x = member.x_local
+def expected_figure_13(x):
+    """[1, Fig. 13] Cantilever Beam - Concentrated Load at Free End."""
+    R = P
+    M = P * L
 
-    # Expected results
-    R1 = 3 * w * L / 8
-    R2 = 5 * w * L / 8
-    M = w * L**2 / 8
+    return {
+        "R2": R,
+        "M2": M,
+        "shear_forces_z": np.broadcast_to(-R, x.shape),
+        "bending_moments_y": -P * x,
+        "translations_z": -P * (2 * L**3 - 3 * L**2 * x + x**3) / (6 * E * I),
+        "min_max_shear_forces_z": min_max(-R, -R),
+        "min_max_bending_moments_y": min_max(0.0, -M),
+    }
 
-    # Expected internal forces & displacements
-    shear_forces_z = R1 - w * x
-    bending_moments_y = R1 * x - w * x**2 / 2
-    translations_z = -w * x * (L**3 - 3 * L * x**2 + 2 * x**3) / (48 * E * I)
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([9 * w * L**2 / 128, -M])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-    assert_almost_equal(node_2.results.reaction_moment_y[load_case], M)
-
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
+def expected_figure_14(x):
+    """[1, Fig. 14] Cantilever Beam - Concentrated Load at Any Point."""
+    a, b = a1, b1
 
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
+    R = P
+    M = P * b
 
+    # Expected internal forces & displacements
+    left, right = interval_slices(x, a)
+
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
+
+    xi = x[left]
+    shear_forces_z[left] = 0
+    bending_moments_y[left] = 0
+    translations_z[left] = -P * b**2 * (3 * L - 3 * xi - b) / (6 * E * I)
+
+    xi = x[right]
+    shear_forces_z[right] = -R
+    bending_moments_y[right] = -P * (xi - a)
+    translations_z[right] = -P * (L - xi) ** 2 * (3 * b - L + xi) / (6 * E * I)
+
+    # Handle the values of shear force under the load
+    i = discontinuity_index(x, a)
+    shear_forces_z[i] = 0
+    shear_forces_z[i + 1] = -R
+
+    return {
+        "R2": R,
+        "M2": M,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(0.0, -R),
+        "min_max_bending_moments_y": min_max(0.0, -M),
+    }
 
-def test_figure_16() -> None:
-    """[1, Fig. 16] Beam Fixed at One End, Supported at Other - Concentrated Load at Center."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load([0, 0, -P, 0, 0, 0], load_case, x=0.5)
+def expected_figure_15(x):
+    """[1, Fig. 15] Beam Fixed at One End, Supported at Other - Uniformly Distributed Load."""
+    R1 = 3 * w * L / 8
+    R2 = 5 * w * L / 8
+    M = w * L**2 / 8
 
-    solver = LinearStaticSolver(model)
-    solver.solve()
+    x2 = x * x
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "M2": M,
+        "shear_forces_z": R1 - w * x,
+        "bending_moments_y": R1 * x - w * x2 / 2,
+        "translations_z": -w * x * (L**3 - 3 * L * x2 + 2 * x2 * x) / (48 * E * I),
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(9 * w * L**2 / 128, -M),
+    }
 
-    x = member.x_local
 
-    # Expected results
+def expected_figure_16(x):
+    """[1, Fig. 16] Beam Fixed at One End, Supported at Other - Concentrated Load at Center."""
     R1 = 5 * P / 16
     R2 = 11 * P / 16
     M = 3 * P * L / 16
 
     # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= L / 2
-    shear_forces_z[interval] = R1
-    bending_moments_y[interval] = 5 * P * x[interval] / 16
-    translations_z[interval] = (
-        -P * x[interval] * (3 * L**2 - 5 * x[interval] ** 2) / (96 * E * I)
-    )
-
-    interval = x > L / 2
-    shear_forces_z[interval] = -R2
-    bending_moments_y[interval] = P * (L / 2 - 11 * x[interval] / 16)
-    translations_z[interval] = (
-        -P * (x[interval] - L) ** 2 * (11 * x[interval] - 2 * L) / (96 * E * I)
-    )
+    left, right = interval_slices(x, L / 2)
 
-    interval = np.where(np.isclose(x, L / 2))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = -R2
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
 
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([5 * P * L / 32, -M])
+    xi = x[left]
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = 5 * P * xi / 16
+    translations_z[left] = -P * xi * (3 * L**2 - 5 * xi**2) / (96 * E * I)
 
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-    assert_almost_equal(node_2.results.reaction_moment_y[load_case], M)
+    xi = x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = P * (L / 2 - 11 * xi / 16)
+    translations_z[right] = -P * (xi - L) ** 2 * (11 * xi - 2 * L) / (96 * E * I)
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
-
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
-    )
+    # Handle the mid-values of shear force
+    i = discontinuity_index(x, L / 2)
+    shear_forces_z[i] = R1
+    shear_forces_z[i + 1] = -R2
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "M2": M,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(5 * P * L / 32, -M),
+    }
 
 
-def test_figure_17() -> None:
+def expected_figure_17(x):
     """[1, Fig. 17] Beam Fixed at One End, Supported at Other - Concentrated Load at Any Point."""
-    model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
-
     a, b = a1, b1
 
-    # Load in [1] is applied in the negative z-direction
-    member.add_point_load(
-        [0, 0, -P, 0, 0, 0], load_case, x=a, coordinate_definition="absolute"
-    )
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    x = member.x_local
-
-    # Expected results
     R1 = P * b**2 * (a + 2 * L) / (2 * L**3)
     R2 = P * a * (3 * L**2 - a**2) / (2 * L**3)
     M = P * a * b * (a + L) / (2 * L**2)
 
     # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= a
-    shear_forces_z[interval] = R1
-    bending_moments_y[interval] = R1 * x[interval]
-    translations_z[interval] = (
-        -P
-        * b**2
-        * x[interval]
-        * (3 * a * L**2 - 2 * L * x[interval] ** 2 - a * x[interval] ** 2)
-        / (12 * E * I * L**3)
+    left, right = interval_slices(x, a)
+
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
+
+    xi = x[left]
+    xi2 = xi * xi
+    shear_forces_z[left] = R1
+    bending_moments_y[left] = R1 * xi
+    translations_z[left] = (
+        -P * b**2 * xi * (3 * a * L**2 - 2 * L * xi2 - a * xi2) / (12 * E * I * L**3)
     )
 
-    interval = x > a
-    shear_forces_z[interval] = -R2
-    bending_moments_y[interval] = R1 * x[interval] - P * (x[interval] - a)
-    translations_z[interval] = (
+    xi = x[right]
+    shear_forces_z[right] = -R2
+    bending_moments_y[right] = R1 * xi - P * (xi - a)
+    translations_z[right] = (
         -P
         * a
-        * (L - x[interval]) ** 2
-        * (3 * L**2 * x[interval] - a**2 * x[interval] - 2 * a**2 * L)
+        * (L - xi) ** 2
+        * (3 * L**2 * xi - a**2 * xi - 2 * a**2 * L)
         / (12 * E * I * L**3)
     )
 
-    interval = np.where(np.isclose(x, a))[0]
-    shear_forces_z[interval[0]] = R1
-    shear_forces_z[interval[1]] = -R2
+    # Handle the values of shear force under the load
+    i = discontinuity_index(x, a)
+    shear_forces_z[i] = R1
+    shear_forces_z[i + 1] = -R2
+
+    return {
+        "R1": R1,
+        "R2": R2,
+        "M2": M,
+        "shear_forces_z": shear_forces_z,
+        "bending_moments_y": bending_moments_y,
+        "translations_z": translations_z,
+        "min_max_shear_forces_z": min_max(R1, -R2),
+        "min_max_bending_moments_y": min_max(R1 * a, -M),
+    }
 
-    min_max_shear = np.sort([R1, -R2])
-    min_max_moment = np.sort([R1 * a, -M])
 
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-    assert_almost_equal(node_2.results.reaction_moment_y[load_case], M)
+CANTILEVER_CASES = [
+    ("figure_12", [("distributed", LOAD_UNIFORM, {})], expected_figure_12),
+    ("figure_13", [("nodal", LOAD_POINT, {})], expected_figure_13),
+    (
+        "figure_14",
+        [("point", LOAD_POINT, {"x": a1, "coordinate_definition": "absolute"})],
+        expected_figure_14,
+    ),
+]
+
+PROPPED_BEAM_CASES = [
+    ("figure_15", [("distributed", LOAD_UNIFORM, {})], expected_figure_15),
+    ("figure_16", [("point", LOAD_POINT, {"x": 0.5})], expected_figure_16),
+    (
+        "figure_17",
+        [("point", LOAD_POINT, {"x": a1, "coordinate_definition": "absolute"})],
+        expected_figure_17,
+    ),
+]
+
+# Support layouts: (fixity of N1, fixity of N2, cases). Every layout is solved as one model.
+BEAM_LAYOUTS = [
+    (BC_PIN, BC_ROLLER, SIMPLE_BEAM_CASES),
+    (BC_FREE, BC_FIXED, CANTILEVER_CASES),
+    (BC_PIN, BC_FIXED, PROPPED_BEAM_CASES),
+]
+
+
+def add_loads(member, node, load_case, loads):
+    """Add ``loads`` to ``load_case``, nodal loads to ``node`` and member loads to ``member``."""
+    for kind, components, kwargs in loads:
+        target = node if kind == "nodal" else member
+        getattr(target, f"add_{kind}_load")(components, load_case, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def solved_beams(dummy_section):
+    """
+    Return the solved member, end nodes and load case of every beam case, keyed by case id.
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
-    )
+    All cases of a support layout share the stiffness matrix, so each layout is built and
+    solved once, with one load case per case.
+    """
+    solved = {}
+    for fixity_1, fixity_2, cases in BEAM_LAYOUTS:
+        model, member, node_1, node_2 = build_beam(dummy_section, fixity_1, fixity_2)
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
+        load_cases = {}
+        for case, loads, _ in cases:
+            load_cases[case] = model.add_load_case(case)
+            add_loads(member, node_1, load_cases[case], loads)
 
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
+        solver = LinearStaticSolver(model)
+        solver.solve()
+
+        for case, load_case in load_cases.items():
+            solved[case] = (member, (node_1, node_2), load_case)
+
+    return solved
+
+
+@pytest.mark.parametrize(
+    ("case", "expected_results"),
+    [
+        pytest.param(case, expected, id=case)
+        for *_, cases in BEAM_LAYOUTS
+        for case, _, expected in cases
+    ],
+)
+def test_beam(solved_beams, case, expected_results) -> None:
+    """[1, Figs. 1-17] Simple beams, cantilevers and propped cantilevers under various loads."""
+    member, nodes, load_case = solved_beams[case]
+
+    assert_beam_results(member, nodes, load_case, expected_results(member.x_local))
+
+
+def test_figure_11_combinations(simple_beam) -> None:
+    """[1, Fig. 11] Simple Beam - Two Unequal Concentrated Loads Unsymmetrically Placed."""
+    model, member, node_1, node_2, lc1 = simple_beam
+    lc2 = model.add_load_case("LC2")
+
+    combination = {
+        lc1: 1.0,
+        lc2: 2.0,
+    }
+
+    comb = model.add_load_case_combination("CO1", combination)
+
+    a, b = a2, b2
+
+    # Load in [1] is applied in the negative z-direction
+    member.add_point_load(LOAD_POINT_1, lc1, x=a, coordinate_definition="absolute")
+    member.add_point_load(
+        [0, 0, -P2 / 2, 0, 0, 0], lc2, x=L - b, coordinate_definition="absolute"
     )
 
+    solver = LinearStaticSolver(model)
+    solver.solve()
+
+    expected = expected_figure_11(member.x_local)
+    assert_beam_results(member, (node_1, node_2), comb, expected)
+
 
-def test_figure_18() -> None:
+def test_figure_18(dummy_section) -> None:
     """
     [1, Fig. 18] Beam Overhanging One Support - Uniform Distributed Load.
 
@@ -1361,28 +1010,24 @@ def test_figure_18() -> None:
     a = 1
 
     model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_3 = model.add_node(
-        "N3", [L + a], ["free", "free", "free", "free", "free", "free"]
-    )
-    member = model.add_member("M1", "navier", [node_1, node_3], DUMMY_SEC)
+    node_1 = model.add_node("N1", [], BC_PIN)
+    node_3 = model.add_node("N3", [L + a], BC_FREE)
+    member = model.add_member("M1", "navier", [node_1, node_3], dummy_section)
 
     node_2 = member.add_node(
         "N2",
         L,
-        ["free", "free", "fixed", "free", "free", "free"],
+        BC_ROLLER,
         coordinate_definition="absolute",
     )
 
     load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
 
     # Load in [1] is applied in the negative z-direction
-    member.add_distributed_load([0, 0, -w, 0, 0, -w], load_case)
+    member.add_distributed_load(LOAD_UNIFORM, load_case)
 
-    solver.solve(True)
+    solver = LinearStaticSolver(model)
+    solver.solve()
 
     x = member.x_local
 
@@ -1395,71 +1040,61 @@ def test_figure_18() -> None:
     R2 = V2 + V3
 
     # Expected internal forces & displacements
-    shear_forces_z = np.zeros(x.shape)
-    bending_moments_y = np.zeros(x.shape)
-    translations_z = np.zeros(x.shape)
-
-    interval = x <= L
-    shear_forces_z[interval] = R1 - w * x[interval]
-    bending_moments_y[interval] = (
-        w * x[interval] * (L**2 - a**2 - x[interval] * L) / (2 * L)
-    )
-    translations_z[interval] = (
+    shear_forces_z = np.empty_like(x)
+    bending_moments_y = np.empty_like(x)
+    translations_z = np.empty_like(x)
+
+    left, right = interval_slices(x, L)
+
+    xi = x[left]
+    xi2 = xi * xi
+    shear_forces_z[left] = R1 - w * xi
+    bending_moments_y[left] = w * xi * (L**2 - a**2 - xi * L) / (2 * L)
+    translations_z[left] = (
         -w
-        * x[interval]
-        * (
-            L**4
-            - 2 * L**2 * x[interval] ** 2
-            + L * x[interval] ** 3
-            - 2 * a**2 * L**2
-            + 2 * a**2 * x[interval] ** 2
-        )
+        * xi
+        * (L**4 - 2 * L**2 * xi2 + L * xi2 * xi - 2 * a**2 * L**2 + 2 * a**2 * xi2)
         / (24 * E * I * L)
     )
 
-    interval = x > L
-    xl = x[interval] - L
-    shear_forces_z[interval] = w * (a - xl)
-    bending_moments_y[interval] = -w * (a - xl) ** 2 / 2
-    translations_z[interval] = (
+    # Overhang, xl is measured from the right support
+    xl = x[right] - L
+    xl2 = xl * xl
+    shear_forces_z[right] = w * (a - xl)
+    bending_moments_y[right] = -w * (a - xl) ** 2 / 2
+    translations_z[right] = (
         -w
         * xl
-        * (4 * a**2 * L - L**3 + 6 * a**2 * xl - 4 * a * xl**2 + xl**3)
+        * (4 * a**2 * L - L**3 + 6 * a**2 * xl - 4 * a * xl2 + xl2 * xl)
         / (24 * E * I)
     )
 
-    interval = np.where(np.isclose(x, L))[0]
-    shear_forces_z[interval[0]] = -V3
-    shear_forces_z[interval[1]] = V2
-
-    min_max_shear = np.sort([np.sign(V2) * np.max([abs(V1), abs(V2)]), -V3])
-    min_max_moment = np.sort(
-        [w * (L + a) ** 2 * (L - a) ** 2 / (8 * L**2), -w * a**2 / 2]
-    )
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
+    i = discontinuity_index(x, L)
+    shear_forces_z[i] = -V3
+    shear_forces_z[i + 1] = V2
 
-    # Internal forces
-    assert_array_almost_equal(member.results.shear_forces_z[load_case], shear_forces_z)
-    assert_array_almost_equal(
-        member.results.bending_moments_y[load_case], bending_moments_y
+    min_max_shear = min_max(np.sign(V2) * max(abs(V1), abs(V2)), -V3)
+    min_max_moment = min_max(
+        w * (L + a) ** 2 * (L - a) ** 2 / (8 * L**2), -w * a**2 / 2
     )
 
-    # Displacements
-    assert_array_almost_equal(member.results.translations_z[load_case], translations_z)
-
-    # Extremes
-    assert_array_almost_equal(
-        member.results.min_max_shear_forces_z[load_case], min_max_shear
-    )
-    assert_array_almost_equal(
-        member.results.min_max_bending_moments_y[load_case], min_max_moment
+    assert_beam_results(
+        member,
+        (node_1, node_2),
+        load_case,
+        {
+            "R1": R1,
+            "R2": R2,
+            "shear_forces_z": shear_forces_z,
+            "bending_moments_y": bending_moments_y,
+            "translations_z": translations_z,
+            "min_max_shear_forces_z": min_max_shear,
+            "min_max_bending_moments_y": min_max_moment,
+        },
     )
 
 
-def test_figure_19() -> None:
+def test_figure_19(dummy_section) -> None:
     """
     [1, Fig. 19] Beam Overhanging One Support - Uniformly Distributed Load on Overhang.
 
@@ -1470,25 +1105,19 @@ def test_figure_19() -> None:
     a = 1
 
     model = FrameXZModel()
-    node_1 = model.add_node(
-        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
-    )
-    node_3 = model.add_node(
-        "N3", [L + a], ["free", "free", "free", "free", "free", "free"]
-    )
+    node_1 = model.add_node("N1", [], BC_PIN)
+    node_2 = model.add_node("N2", [L], BC_ROLLER)
+    node_3 = model.add_node("N3", [L + a], BC_FREE)
 
-    member_1 = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
-    member_2 = model.add_member("M2", "navier", [node_2, node_3], DUMMY_SEC)
+    member_1 = model.add_member("M1", "navier", [node_1, node_2], dummy_section)
+    member_2 = model.add_member("M2", "navier", [node_2, node_3], dummy_section)
 
     load_case = model.add_load_case("LC1")
-    solver = LinearStaticSolver(model)
 
     # Load in [1] is applied in the negative z-direction
-    member_2.add_distributed_load([0, 0, -w, 0, 0, -w], load_case)
+    member_2.add_distributed_load(LOAD_UNIFORM, load_case)
 
+    solver = LinearStaticSolver(model)
     solver.solve()
 
     x = member_1.x_local
@@ -1499,60 +1128,50 @@ def test_figure_19() -> None:
     R2 = w * a * (2 * L + a) / (2 * L)
 
     # Expected internal forces & displacements
-    shear_forces_z_1 = np.full(x.shape, R1)
+    shear_forces_z_1 = np.broadcast_to(R1, x.shape)
     shear_forces_z_2 = w * (a - x1)
 
     bending_moments_y_1 = R1 * x
     bending_moments_y_2 = -w * (a - x1) ** 2 / 2
 
+    x1_2 = x1 * x1
+
     translations_z_1 = w * a**2 * x * (L**2 - x**2) / (12 * E * I * L)
     translations_z_2 = (
-        -w * x1 * (4 * a**2 * L + 6 * a**2 * x1 - 4 * a * x1**2 + x1**3) / (24 * E * I)
-    )
-
-    min_max_shear_1 = np.sort([R1, R1])
-    min_max_shear_2 = np.sort([0, w * a])
-    min_max_moment_1 = np.sort([0, -w * a**2 / 2])
-    min_max_moment_2 = np.sort([0, -w * a**2 / 2])
-
-    # Reactions
-    assert_almost_equal(node_1.results.reaction_force_z[load_case], R1)
-    assert_almost_equal(node_2.results.reaction_force_z[load_case], R2)
-
-    # Internal forces
-    assert_array_almost_equal(
-        member_1.results.shear_forces_z[load_case], shear_forces_z_1
-    )
-    assert_array_almost_equal(
-        member_1.results.bending_moments_y[load_case], bending_moments_y_1
-    )
-
-    assert_array_almost_equal(
-        member_2.results.shear_forces_z[load_case], shear_forces_z_2
-    )
-    assert_array_almost_equal(
-        member_2.results.bending_moments_y[load_case], bending_moments_y_2
-    )
-
-    # Displacements
-    assert_array_almost_equal(
-        member_1.results.translations_z[load_case], translations_z_1
-    )
-    assert_array_almost_equal(
-        member_2.results.translations_z[load_case], translations_z_2
+        -w
+        * x1
+        * (4 * a**2 * L + 6 * a**2 * x1 - 4 * a * x1_2 + x1_2 * x1)
+        / (24 * E * I)
     )
 
-    # Extremes
-    assert_array_almost_equal(
-        member_1.results.min_max_shear_forces_z[load_case], min_max_shear_1
-    )
-    assert_array_almost_equal(
-        member_1.results.min_max_bending_moments_y[load_case], min_max_moment_1
-    )
+    min_max_shear_1 = min_max(R1, R1)
+    min_max_shear_2 = min_max(0.0, w * a)
+    min_max_moment_1 = min_max(0.0, -w * a**2 / 2)
+    min_max_moment_2 = min_max(0.0, -w * a**2 / 2)
 
-    assert_array_almost_equal(
-        member_2.results.min_max_shear_forces_z[load_case], min_max_shear_2
-    )
-    assert_array_almost_equal(
-        member_2.results.min_max_bending_moments_y[load_case], min_max_moment_2
+    assert_beam_results(
+        member_1,
+        (node_1, node_2),
+        load_case,
+        {
+            "R1": R1,
+            "R2": R2,
+            "shear_forces_z": shear_forces_z_1,
+            "bending_moments_y": bending_moments_y_1,
+            "translations_z": translations_z_1,
+            "min_max_shear_forces_z": min_max_shear_1,
+            "min_max_bending_moments_y": min_max_moment_1,
+        },
+    )
+    assert_beam_results(
+        member_2,
+        (node_2, node_3),
+        load_case,
+        {
+            "shear_forces_z": shear_forces_z_2,
+            "bending_moments_y": bending_moments_y_2,
+            "translations_z": translations_z_2,
+            "min_max_shear_forces_z": min_max_shear_2,
+            "min_max_bending_moments_y": min_max_moment_2,
+        },
     )
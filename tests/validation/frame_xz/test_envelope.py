@@ -1,20 +1,23 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_array_almost_equal
 
 from framesss.fea.models.frame_xz import FrameXZModel
-from framesss.pre.material import Material
-from framesss.pre.section import Section
 from framesss.solvers.linear_static import LinearStaticSolver
 
 L = 4.0  # Length
 F = 2  # Force
 E = 210.0e9  # Elastic modulus
 I = 2.0e-3  # Second moment of inertia
-DUMMY_MAT = Material("foo", E, 1, 1, 1)
-DUMMY_SEC = Section("bar", 1, 1, 1, 1, I, 1, 1, 1, DUMMY_MAT)
 
 
-def test_simple_beam_3_point_loads() -> None:
+@pytest.fixture(scope="module")
+def dummy_section(make_dummy_section):
+    """Return a section matching the elastic modulus and inertia of this module."""
+    return make_dummy_section(E, I)
+
+
+def test_simple_beam_3_point_loads(dummy_section) -> None:
     """Simple beam - Uniformly Distributed Load."""
     model = FrameXZModel()
     node_1 = model.add_node(
@@ -23,7 +26,7 @@ def test_simple_beam_3_point_loads() -> None:
     node_2 = model.add_node(
         "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
     )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
+    member = model.add_member("M1", "navier", [node_1, node_2], dummy_section)
 
     lc1 = model.add_load_case("LC1")
     member.add_point_load(
@@ -43,46 +46,32 @@ def test_simple_beam_3_point_loads() -> None:
     envelope = model.add_envelope("ENV1", [lc1, lc2, lc3])
 
     solver = LinearStaticSolver(model)
-    solver.solve(verbose=True)
+    solver.solve()
 
     # EXPECTED RESULTS:
     x = member.x_local
 
-    min_moments_1 = np.linspace(0, -1, int(x.shape[0] / 4))
-    min_moments_2 = np.linspace(-1, -2, int(x.shape[0] / 4))
-    min_moments = np.concatenate((min_moments_1, min_moments_2))
-    min_moments = np.concatenate((min_moments, np.flip(min_moments)))
-
-    max_moments_1 = np.linspace(0, 1.5, int(x.shape[0] / 4))
-    max_moments_2 = np.linspace(1.5, 1, int(x.shape[0] / 4))
-    max_moments = np.concatenate((max_moments_1, max_moments_2))
-    max_moments = np.concatenate((max_moments, np.flip(max_moments)))
+    # Moment envelopes are piecewise linear between the load points
+    x_points = [0, L / 4, L / 2, 3 * L / 4, L]
+    min_moments = np.interp(x, x_points, [0, -1, -2, -1, 0])
+    max_moments = np.interp(x, x_points, [0, 1.5, 1, 1.5, 0])
 
     assert_array_almost_equal(
         member.results.bending_moments_y[envelope],
         np.array([min_moments, max_moments]),
     )
 
-    min_shear_1 = np.full(int(x.shape[0] / 4), -1.0)
-    min_shear_2 = np.full(int(x.shape[0] / 4), -1.0)
-    min_shear_3 = np.full(int(x.shape[0] / 4), -0.5)
-    min_shear_4 = np.full(int(x.shape[0] / 4), -1.5)
-
-    min_shear = np.concatenate((min_shear_1, min_shear_2, min_shear_3, min_shear_4))
-
-    max_shear_1 = np.full(int(x.shape[0] / 4), +1.5)
-    max_shear_2 = np.full(int(x.shape[0] / 4), +0.5)
-    max_shear_3 = np.full(int(x.shape[0] / 4), +1.0)
-    max_shear_4 = np.full(int(x.shape[0] / 4), +1.0)
-
-    max_shear = np.concatenate((max_shear_1, max_shear_2, max_shear_3, max_shear_4))
+    # Shear envelopes are constant over each of the four elements
+    n_points = x.shape[0] // 4
+    min_shear = np.repeat([-1.0, -1.0, -0.5, -1.5], n_points)
+    max_shear = np.repeat([+1.5, +0.5, +1.0, +1.0], n_points)
 
     assert_array_almost_equal(
         member.results.shear_forces_z[envelope], np.array([min_shear, max_shear])
     )
 
 
-def test_simple_beam_uniformly_distributed_load() -> None:
+def test_simple_beam_uniformly_distributed_load(dummy_section) -> None:
     """Simple beam - Uniformly Distributed Load."""
     model = FrameXZModel()
     node_1 = model.add_node(
@@ -91,7 +80,7 @@ def test_simple_beam_uniformly_distributed_load() -> None:
     node_2 = model.add_node(
         "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
     )
-    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
+    member = model.add_member("M1", "navier", [node_1, node_2], dummy_section)
 
     lc1 = model.add_load_case("LC1")
     member.add_distributed_load(load_components=[0, 0, -F, 0, 0, -F], load_case=lc1)
@@ -104,7 +93,7 @@ def test_simple_beam_uniformly_distributed_load() -> None:
     envelope = model.add_envelope("ENV1", [lc1, lc2])
 
     solver = LinearStaticSolver(model)
-    solver.solve(verbose=True)
+    solver.solve()
 
     # EXPECTED RESULTS:
     x = member.x_local
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from framesss.fea.models.frame_xz import FrameXZModel
+from framesss.solvers.linear_static import LinearStaticSolver
+
+L = 4.0  # Length
+F = 2  # Force
+E = 210.0e9  # Elastic modulus
+I = 2.0e-3  # Second moment of inertia
+
+
+@pytest.fixture(scope="module")
+def dummy_section(make_dummy_section):
+    """Return a section matching the elastic modulus and inertia of this module."""
+    return make_dummy_section(E, I)
+
+
+def test_empty_load_case_combination(dummy_section) -> None:
+    """Combination without any load cases yields zero results."""
+    model = FrameXZModel()
+    node_1 = model.add_node(
+        "N1", [], ["fixed", "free", "fixed", "free", "free", "free"]
+    )
+    node_2 = model.add_node(
+        "N2", [L], ["free", "free", "fixed", "free", "free", "free"]
+    )
+    member = model.add_member("M1", "navier", [node_1, node_2], dummy_section)
+
+    lc1 = model.add_load_case("LC1")
+    member.add_distributed_load(load_components=[0, 0, -F, 0, 0, -F], load_case=lc1)
+
+    combination = model.add_load_case_combination("CO1", {})
+
+    solver = LinearStaticSolver(model)
+    solver.solve()
+
+    n_points = member.x_local.shape[0]
+
+    assert node_1.results.reaction_force_z[combination] == 0.0
+    assert node_2.results.translation_x[combination] == 0.0
+
+    assert_array_almost_equal(
+        member.results.bending_moments_y[combination], np.zeros(n_points)
+    )
+    assert_array_almost_equal(
+        member.results.translations_z[combination], np.zeros(n_points)
+    )
@@ -8,6 +8,7 @@ Test examples were taken from the following publication:
 """
 
 import numpy as np
+import pytest
 from numpy.testing import assert_almost_equal
 from numpy.testing import assert_array_almost_equal
 
@@ -17,13 +18,13 @@ from framesss.pre.section import Section
 from framesss.solvers.linear_static import LinearStaticSolver
 
 
-def test_example_5_2() -> None:
+@pytest.fixture(scope="module")
+def example_5_2():
     """
     [2, Ex. 5.2] Frame under force load.
 
-    In the publication [2], the Z-axis points downwards, but in framesss, the Z-axis
-    is considered pointing upwards. Because of this, the translations in the Z-axis
-    direction taken from [2] are multiplied by -1.
+    The frame is solved once for the whole load in one load case and for the same load split into
+    scaled load cases of a combination, so both tests of the example share one analysis.
     """
     material = Material("test", 30.0e6, 0.2, 1, 0)
     section = Section(
@@ -59,301 +60,147 @@ def test_example_5_2() -> None:
     )
     member_65 = model.add_member("6-5", "navier", [node_6, node_5], section)
 
-    lc = model.add_load_case("LC1")
-
-    member_12.add_distributed_load([10, 0, 0, 10, 0, 0], lc)
-    member_34.add_point_load([0, 0, -15, 0, 0, 0], lc, x=1.8 / 3)
-    member_65.add_point_load([0, 0, -20, 0, 0, 0], lc, x=0.5)
-
-    node_6.add_nodal_load([4, 0, 0, 0, 0, 0], lc)
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    assert_almost_equal(node_1.results.reaction_force_x[lc], -20.781, decimal=3)
-    assert_almost_equal(node_1.results.reaction_force_z[lc], 0, decimal=3)
-    assert_almost_equal(node_1.results.reaction_moment_y[lc], -14.375, decimal=3)
-
-    assert_almost_equal(node_2.results.reaction_force_x[lc], -15.258, decimal=3)
-    assert_almost_equal(node_2.results.reaction_force_z[lc], 3.75, decimal=3)
-
-    assert_almost_equal(node_2.results.rotation_y[lc], -6.942e-5)
-
-    assert_almost_equal(node_3.results.translation_x[lc], -9.903e-5)
-    assert_almost_equal(node_3.results.translation_z[lc], -9.168e-4)
-
-    assert_almost_equal(node_4.results.reaction_force_x[lc], -7.961, decimal=3)
-    assert_almost_equal(node_4.results.reaction_force_z[lc], 23.249, decimal=3)
-    assert_almost_equal(node_4.results.reaction_moment_y[lc], 10.906, decimal=3)
-
-    assert_almost_equal(node_6.results.reaction_force_z[lc], 8, decimal=3)
-
-    assert_array_almost_equal(
-        member_12.results.min_max_axial_forces[lc], [0, 0], decimal=3
-    )
-    assert_array_almost_equal(
-        member_12.results.min_max_shear_forces_z[lc], [-19.219, 20.781], decimal=3
-    )
-    assert_array_almost_equal(
-        member_12.results.min_max_bending_moments_y[lc], [-14.375, 7.217], decimal=3
-    )
-
-    assert_array_almost_equal(
-        member_23.results.min_max_axial_forces[lc], [-3.961, -3.961], decimal=3
-    )
-    assert_array_almost_equal(
-        member_23.results.min_max_shear_forces_z[lc], [3.75, 3.75], decimal=3
-    )
-    assert_array_almost_equal(
-        member_23.results.min_max_bending_moments_y[lc], [-11.251, 0], decimal=3
-    )
-
-    assert_array_almost_equal(
-        member_34.results.min_max_axial_forces[lc], [-23.376, -11.376], decimal=3
-    )
-    assert_array_almost_equal(
-        member_34.results.min_max_shear_forces_z[lc], [-7.581, 1.419], decimal=3
-    )
-    assert_array_almost_equal(
-        member_34.results.min_max_bending_moments_y[lc], [-10.906, 4.257], decimal=3
-    )
-
-    assert_array_almost_equal(
-        member_35.results.min_max_axial_forces[lc], [-12, -12], decimal=3
-    )
-    assert_array_almost_equal(
-        member_35.results.min_max_shear_forces_z[lc], [4, 4], decimal=3
-    )
-    assert_array_almost_equal(
-        member_35.results.min_max_bending_moments_y[lc], [-0, 6], decimal=3
-    )
-
-    assert_array_almost_equal(
-        member_65.results.min_max_axial_forces[lc], [-4, -4], decimal=3
-    )
-    assert_array_almost_equal(
-        member_65.results.min_max_shear_forces_z[lc], [-12, 8], decimal=3
-    )
-    assert_array_almost_equal(
-        member_65.results.min_max_bending_moments_y[lc], [-6, 12], decimal=3
-    )
-
-
-def test_example_5_2_combinations() -> None:
-    """
-    [2, Ex. 5.2] Frame under force load.
-
-    In the publication [2], the Z-axis points downwards, but in framesss, the Z-axis
-    is considered pointing upwards. Because of this, the translations in the Z-axis
-    direction taken from [2] are multiplied by -1.
-    """
-    material = Material("test", 30.0e6, 0.2, 1, 0)
-    section = Section(
-        "test", 4.0e-3, 4.0e-3, 4.0e-3, 1.0e-3, 1.0e-3, 1.0e-3, 1, 1, material
-    )
-
-    model = FrameXZModel()
-
-    node_1 = model.add_node(
-        "N1", [0, 0, 0], ["FIXed", "free", "fixed", "free", "fixed", "free"]
-    )
-    node_2 = model.add_node(
-        "N2", [0, 0, 4], ["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_3 = model.add_node("N3", [3, 0, 4])
-    node_4 = model.add_node(
-        "N4", [6, 0, 0], ["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    node_5 = model.add_node("N5", [3, 0, 5.5])
-    node_6 = model.add_node(
-        "N6", [0, 0, 5.5], ["free", "free", "fixed", "free", "free", "free"]
-    )
+    lc1 = model.add_load_case("LC1")
 
-    member_12 = model.add_member("1-2", "navier", [node_1, node_2], section)
-    member_23 = model.add_member(
-        "2-3", "navier", [node_2, node_3], section, ["fixed", "hinged"]
-    )
-    member_34 = model.add_member(
-        "3-4", "navier", [node_3, node_4], section, ["hinged", "fixed"]
-    )
-    member_35 = model.add_member(
-        "3-5", "navier", [node_3, node_5], section, ["hinged", "fixed"]
-    )
-    member_65 = model.add_member("6-5", "navier", [node_6, node_5], section)
+    member_12.add_distributed_load([10, 0, 0, 10, 0, 0], lc1)
+    member_34.add_point_load([0, 0, -15, 0, 0, 0], lc1, x=1.8 / 3)
+    member_65.add_point_load([0, 0, -20, 0, 0, 0], lc1, x=0.5)
 
-    lc1 = model.add_load_case("LC1")
-    f1 = 2
-    member_12.add_distributed_load(np.array([10, 0, 0, 10, 0, 0]) / f1, lc1)
+    node_6.add_nodal_load([4, 0, 0, 0, 0, 0], lc1)
 
     lc2 = model.add_load_case("LC2")
-    f2 = -1
-    member_34.add_point_load(np.array([0, 0, -15, 0, 0, 0]) / f2, lc2, x=1.8 / 3)
+    f2 = 2
+    member_12.add_distributed_load(np.array([10, 0, 0, 10, 0, 0]) / f2, lc2)
 
     lc3 = model.add_load_case("LC3")
-    f3 = 1
-    member_65.add_point_load(np.array([0, 0, -20, 0, 0, 0]) / f3, lc3, x=0.5)
+    f3 = -1
+    member_34.add_point_load(np.array([0, 0, -15, 0, 0, 0]) / f3, lc3, x=1.8 / 3)
 
     lc4 = model.add_load_case("LC4")
-    f4 = 4
-    node_6.add_nodal_load(np.array([4, 0, 0, 0, 0, 0]) / f4, lc4)
+    f4 = 1
+    member_65.add_point_load(np.array([0, 0, -20, 0, 0, 0]) / f4, lc4, x=0.5)
+
+    lc5 = model.add_load_case("LC5")
+    f5 = 4
+    node_6.add_nodal_load(np.array([4, 0, 0, 0, 0, 0]) / f5, lc5)
 
-    comb = model.add_load_case_combination("CO1", {lc1: f1, lc2: f2, lc3: f3, lc4: f4})
+    comb = model.add_load_case_combination("CO1", {lc2: f2, lc3: f3, lc4: f4, lc5: f5})
 
     solver = LinearStaticSolver(model)
     solver.solve()
 
-    assert_almost_equal(node_1.results.reaction_force_x[comb], -20.781, decimal=3)
-    assert_almost_equal(node_1.results.reaction_force_z[comb], 0, decimal=3)
-    assert_almost_equal(node_1.results.reaction_moment_y[comb], -14.375, decimal=3)
+    nodes = (node_1, node_2, node_3, node_4, node_5, node_6)
+    members = (member_12, member_23, member_34, member_35, member_65)
+
+    return nodes, members, lc1, comb
 
-    assert_almost_equal(node_2.results.reaction_force_x[comb], -15.258, decimal=3)
-    assert_almost_equal(node_2.results.reaction_force_z[comb], 3.75, decimal=3)
 
-    assert_almost_equal(node_2.results.rotation_y[comb], -6.942e-5)
+def assert_example_5_2(nodes, members, case):
+    """Assert the results of [2, Ex. 5.2] for ``case``."""
+    node_1, node_2, node_3, node_4, _, node_6 = nodes
+    member_12, member_23, member_34, member_35, member_65 = members
 
-    assert_almost_equal(node_3.results.translation_x[comb], -9.903e-5)
-    assert_almost_equal(node_3.results.translation_z[comb], -9.168e-4)
+    assert_almost_equal(node_1.results.reaction_force_x[case], -20.781, decimal=3)
+    assert_almost_equal(node_1.results.reaction_force_z[case], 0, decimal=3)
+    assert_almost_equal(node_1.results.reaction_moment_y[case], -14.375, decimal=3)
 
-    assert_almost_equal(node_4.results.reaction_force_x[comb], -7.961, decimal=3)
-    assert_almost_equal(node_4.results.reaction_force_z[comb], 23.249, decimal=3)
-    assert_almost_equal(node_4.results.reaction_moment_y[comb], 10.906, decimal=3)
+    assert_almost_equal(node_2.results.reaction_force_x[case], -15.258, decimal=3)
+    assert_almost_equal(node_2.results.reaction_force_z[case], 3.75, decimal=3)
 
-    assert_almost_equal(node_6.results.reaction_force_z[comb], 8, decimal=3)
+    assert_almost_equal(node_2.results.rotation_y[case], -6.942e-5)
+
+    assert_almost_equal(node_3.results.translation_x[case], -9.903e-5)
+    assert_almost_equal(node_3.results.translation_z[case], -9.168e-4)
+
+    assert_almost_equal(node_4.results.reaction_force_x[case], -7.961, decimal=3)
+    assert_almost_equal(node_4.results.reaction_force_z[case], 23.249, decimal=3)
+    assert_almost_equal(node_4.results.reaction_moment_y[case], 10.906, decimal=3)
+
+    assert_almost_equal(node_6.results.reaction_force_z[case], 8, decimal=3)
 
     assert_array_almost_equal(
-        member_12.results.min_max_axial_forces[comb], [0, 0], decimal=3
+        member_12.results.min_max_axial_forces[case], [0, 0], decimal=3
     )
     assert_array_almost_equal(
-        member_12.results.min_max_shear_forces_z[comb], [-19.219, 20.781], decimal=3
+        member_12.results.min_max_shear_forces_z[case], [-19.219, 20.781], decimal=3
     )
     assert_array_almost_equal(
-        member_12.results.min_max_bending_moments_y[comb], [-14.375, 7.217], decimal=3
+        member_12.results.min_max_bending_moments_y[case], [-14.375, 7.217], decimal=3
     )
 
     assert_array_almost_equal(
-        member_23.results.min_max_axial_forces[comb], [-3.961, -3.961], decimal=3
+        member_23.results.min_max_axial_forces[case], [-3.961, -3.961], decimal=3
     )
     assert_array_almost_equal(
-        member_23.results.min_max_shear_forces_z[comb], [3.75, 3.75], decimal=3
+        member_23.results.min_max_shear_forces_z[case], [3.75, 3.75], decimal=3
     )
     assert_array_almost_equal(
-        member_23.results.min_max_bending_moments_y[comb], [-11.251, 0], decimal=3
+        member_23.results.min_max_bending_moments_y[case], [-11.251, 0], decimal=3
     )
 
     assert_array_almost_equal(
-        member_34.results.min_max_axial_forces[comb], [-23.376, -11.376], decimal=3
+        member_34.results.min_max_axial_forces[case], [-23.376, -11.376], decimal=3
     )
     assert_array_almost_equal(
-        member_34.results.min_max_shear_forces_z[comb], [-7.581, 1.419], decimal=3
+        member_34.results.min_max_shear_forces_z[case], [-7.581, 1.419], decimal=3
     )
     assert_array_almost_equal(
-        member_34.results.min_max_bending_moments_y[comb], [-10.906, 4.257], decimal=3
+        member_34.results.min_max_bending_moments_y[case], [-10.906, 4.257], decimal=3
     )
 
     assert_array_almost_equal(
-        member_35.results.min_max_axial_forces[comb], [-12, -12], decimal=3
+        member_35.results.min_max_axial_forces[case], [-12, -12], decimal=3
     )
     assert_array_almost_equal(
-        member_35.results.min_max_shear_forces_z[comb], [4, 4], decimal=3
+        member_35.results.min_max_shear_forces_z[case], [4, 4], decimal=3
     )
     assert_array_almost_equal(
-        member_35.results.min_max_bending_moments_y[comb], [-0, 6], decimal=3
+        member_35.results.min_max_bending_moments_y[case], [-0, 6], decimal=3
     )
 
     assert_array_almost_equal(
-        member_65.results.min_max_axial_forces[comb], [-4, -4], decimal=3
+        member_65.results.min_max_axial_forces[case], [-4, -4], decimal=3
     )
     assert_array_almost_equal(
-        member_65.results.min_max_shear_forces_z[comb], [-12, 8], decimal=3
+        member_65.results.min_max_shear_forces_z[case], [-12, 8], decimal=3
     )
     assert_array_almost_equal(
-        member_65.results.min_max_bending_moments_y[comb], [-6, 12], decimal=3
+        member_65.results.min_max_bending_moments_y[case], [-6, 12], decimal=3
     )
 
 
-def test_example_5_3() -> None:
-    """[2, Ex. 5.3] Frame under thermal load with prescribed displacements."""
-    material = Material("test", 20.0e3, 0.2, 12.0e-6, 0)
-    section = Section("test", 5, 5, 5, 1, 1, 1, 0.3, 0.3, material)
-
-    model = FrameXZModel()
-
-    node_1 = model.add_node(
-        "1", [0, 0, 0], fixity=["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-    node_2 = model.add_node("2", [4, 0, 0])
-    node_3 = model.add_node(
-        "3", [4, 0, -4], fixity=["fixed", "free", "fixed", "free", "free", "free"]
-    )
-    node_4 = model.add_node(
-        "4", [8, 0, -4], fixity=["fixed", "free", "fixed", "free", "fixed", "free"]
-    )
-
-    member_12 = model.add_member("1-2", "navier", [node_1, node_2], section)
-    member_32 = model.add_member(
-        "3-2", "navier", [node_3, node_2], section, ["fixed", "fixed"]
-    )
-    member_34 = model.add_member(
-        "3-4", "navier", [node_3, node_4], section, ["hinged", "fixed"]
-    )
-
-    lc = model.add_load_case("LC1")
-
-    member_32.add_thermal_load([15, 0, 50], lc)
-    node_1.add_prescribed_displacement(0.005, "z", lc)
-    node_4.add_prescribed_displacement(np.deg2rad(10 / 60), "ry", lc)
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
-
-    assert_almost_equal(node_1.results.reaction_force_x[lc], -11.131, decimal=3)
-    assert_almost_equal(node_1.results.reaction_force_z[lc], 19.960, decimal=3)
-    assert_almost_equal(node_1.results.reaction_moment_y[lc], -35.317, decimal=3)
-
-    assert_almost_equal(node_2.results.translation_x[lc], 4.452e-4)
-    assert_almost_equal(node_2.results.translation_z[lc], 1.518e-3, decimal=6)
-    assert_almost_equal(node_2.results.rotation_y[lc], -9.205e-4)
+def test_example_5_2(example_5_2) -> None:
+    """
+    [2, Ex. 5.2] Frame under force load.
 
-    assert_almost_equal(node_3.results.reaction_force_x[lc], 11.131, decimal=3)
-    assert_almost_equal(node_3.results.reaction_force_z[lc], -30.869, decimal=3)
+    In the publication [2], the Z-axis points downwards, but in framesss, the Z-axis
+    is considered pointing upwards. Because of this, the translations in the Z-axis
+    direction taken from [2] are multiplied by -1.
+    """
+    nodes, members, lc, _ = example_5_2
+    assert_example_5_2(nodes, members, lc)
 
-    assert_almost_equal(node_4.results.reaction_force_x[lc], 0, decimal=3)
-    assert_almost_equal(node_4.results.reaction_force_z[lc], 10.909, decimal=3)
-    assert_almost_equal(node_4.results.reaction_moment_y[lc], 43.633, decimal=3)
 
-    assert_array_almost_equal(
-        member_12.results.min_max_axial_forces[lc], [11.131, 11.131], decimal=3
-    )
-    assert_array_almost_equal(
-        member_12.results.min_max_shear_forces_z[lc], [19.960, 19.960], decimal=3
-    )
-    assert_array_almost_equal(
-        member_12.results.min_max_bending_moments_y[lc], [-35.317, 44.523], decimal=3
-    )
+def test_example_5_2_combinations(example_5_2) -> None:
+    """
+    [2, Ex. 5.2] Frame under force load.
 
-    assert_array_almost_equal(
-        member_32.results.min_max_axial_forces[lc], [19.960, 19.960], decimal=3
-    )
-    assert_array_almost_equal(
-        member_32.results.min_max_shear_forces_z[lc], [-11.131, -11.131], decimal=3
-    )
-    assert_array_almost_equal(
-        member_32.results.min_max_bending_moments_y[lc], [-44.523, 0], decimal=3
-    )
+    In the publication [2], the Z-axis points downwards, but in framesss, the Z-axis
+    is considered pointing upwards. Because of this, the translations in the Z-axis
+    direction taken from [2] are multiplied by -1.
+    """
+    nodes, members, _, comb = example_5_2
+    assert_example_5_2(nodes, members, comb)
 
-    assert_array_almost_equal(
-        member_34.results.min_max_axial_forces[lc], [0, 0], decimal=3
-    )
-    assert_array_almost_equal(
-        member_34.results.min_max_shear_forces_z[lc], [-10.909, -10.909], decimal=3
-    )
-    assert_array_almost_equal(
-        member_34.results.min_max_bending_moments_y[lc], [-43.633, 0], decimal=3
-    )
 
+@pytest.fixture(scope="module")
+def example_5_3():
+    """
+    [2, Ex. 5.3] Frame under thermal load with prescribed displacements.
 
-def test_example_5_3_combinations() -> None:
-    """[2, Ex. 5.3] Frame under thermal load with prescribed displacements."""
+    The frame is solved once for the whole load in one load case and for the same load split into
+    scaled load cases of a combination, so both tests of the example share one analysis.
+    """
     material = Material("test", 20.0e3, 0.2, 12.0e-6, 0)
     section = Section("test", 5, 5, 5, 1, 1, 1, 0.3, 0.3, material)
 
@@ -379,185 +226,105 @@ def test_example_5_3_combinations() -> None:
     )
 
     lc1 = model.add_load_case("LC1")
-    f1 = 2
-    member_32.add_thermal_load(np.array([15, 0, 50]) / f1, lc1)
+
+    member_32.add_thermal_load([15, 0, 50], lc1)
+    node_1.add_prescribed_displacement(0.005, "z", lc1)
+    node_4.add_prescribed_displacement(np.deg2rad(10 / 60), "ry", lc1)
 
     lc2 = model.add_load_case("LC2")
-    f2 = -5
-    node_1.add_prescribed_displacement(0.005 / f2, "z", lc2)
+    f2 = 2
+    member_32.add_thermal_load(np.array([15, 0, 50]) / f2, lc2)
 
     lc3 = model.add_load_case("LC3")
-    f3 = 13
-    node_4.add_prescribed_displacement(np.deg2rad(10 / 60) / f3, "ry", lc3)
+    f3 = -5
+    node_1.add_prescribed_displacement(0.005 / f3, "z", lc3)
 
-    comb = model.add_load_case_combination("CO1", {lc1: f1, lc2: f2, lc3: f3})
+    lc4 = model.add_load_case("LC4")
+    f4 = 13
+    node_4.add_prescribed_displacement(np.deg2rad(10 / 60) / f4, "ry", lc4)
+
+    comb = model.add_load_case_combination("CO1", {lc2: f2, lc3: f3, lc4: f4})
 
     solver = LinearStaticSolver(model)
     solver.solve()
 
-    assert_almost_equal(node_1.results.reaction_force_x[comb], -11.131, decimal=3)
-    assert_almost_equal(node_1.results.reaction_force_z[comb], 19.960, decimal=3)
-    assert_almost_equal(node_1.results.reaction_moment_y[comb], -35.317, decimal=3)
-
-    assert_almost_equal(node_2.results.translation_x[comb], 4.452e-4)
-    assert_almost_equal(node_2.results.translation_z[comb], 1.518e-3, decimal=6)
-    assert_almost_equal(node_2.results.rotation_y[comb], -9.205e-4)
-
-    assert_almost_equal(node_3.results.reaction_force_x[comb], 11.131, decimal=3)
-    assert_almost_equal(node_3.results.reaction_force_z[comb], -30.869, decimal=3)
-
-    assert_almost_equal(node_4.results.reaction_force_x[comb], 0, decimal=3)
-    assert_almost_equal(node_4.results.reaction_force_z[comb], 10.909, decimal=3)
-    assert_almost_equal(node_4.results.reaction_moment_y[comb], 43.633, decimal=3)
-
-    assert_array_almost_equal(
-        member_12.results.min_max_axial_forces[comb], [11.131, 11.131], decimal=3
-    )
-    assert_array_almost_equal(
-        member_12.results.min_max_shear_forces_z[comb], [19.960, 19.960], decimal=3
-    )
-    assert_array_almost_equal(
-        member_12.results.min_max_bending_moments_y[comb], [-35.317, 44.523], decimal=3
-    )
-
-    assert_array_almost_equal(
-        member_32.results.min_max_axial_forces[comb], [19.960, 19.960], decimal=3
-    )
-    assert_array_almost_equal(
-        member_32.results.min_max_shear_forces_z[comb], [-11.131, -11.131], decimal=3
-    )
-    assert_array_almost_equal(
-        member_32.results.min_max_bending_moments_y[comb], [-44.523, 0], decimal=3
-    )
-
-    assert_array_almost_equal(
-        member_34.results.min_max_axial_forces[comb], [0, 0], decimal=3
-    )
-    assert_array_almost_equal(
-        member_34.results.min_max_shear_forces_z[comb], [-10.909, -10.909], decimal=3
-    )
-    assert_array_almost_equal(
-        member_34.results.min_max_bending_moments_y[comb], [-43.633, 0], decimal=3
-    )
-
-
-def test_example_5_4() -> None:
-    """[2, Ex. 5.4] Symmetric frame under force load with prescribed displacements."""
-    material = Material("test", 30.0e6, 0.2, 12.0e-6, 0)
-    section = Section(
-        "test", 4.0e-3, 4.0e-3, 4.0e-3, 1.0e-3, 1.0e-3, 1.0e-3, 1, 1, material
-    )
-
-    model = FrameXZModel()
+    nodes = (node_1, node_2, node_3, node_4)
+    members = (member_12, member_32, member_34)
 
-    fixed = ["fixed", "free", "fixed", "free", "fixed", "free"]
-    vertical_roller = ["fixed", "free", "free", "free", "free", "free"]
+    return nodes, members, lc1, comb
 
-    node_1 = model.add_node("1", [0, 0, 0], fixity=fixed)
-    node_2 = model.add_node("2", [6, 0, 0], fixity=fixed)
-    node_3 = model.add_node("3", [12, 0, 0], fixity=fixed)
-    node_4 = model.add_node("4", [3, 0, 4], fixity=vertical_roller)
-    node_5 = model.add_node("5", [6, 0, 4])
-    node_6 = model.add_node("6", [9, 0, 4], fixity=vertical_roller)
 
-    member_14 = model.add_member("1-4", "navier", [node_1, node_4], section)
-    member_45 = model.add_member(
-        "4-5", "navier", [node_4, node_5], section, hinges=["fixed", "hinged"]
-    )
-    member_25 = model.add_member(
-        "2-5", "navier", [node_2, node_5], section, hinges=["fixed", "hinged"]
-    )
-    member_56 = model.add_member(
-        "5-6", "navier", [node_5, node_6], section, hinges=["hinged", "fixed"]
-    )
-    member_63 = model.add_member("6-3", "navier", [node_6, node_3], section)
-
-    lc = model.add_load_case("LC1")
-
-    node_1.add_prescribed_displacement(-0.003, "x", lc)
-    node_3.add_prescribed_displacement(-0.003, "x", lc)
-
-    member_14.add_distributed_load([0, 0, 25, 0, 0, 25], lc, location="projection")
-    member_45.add_distributed_load([0, 0, 25, 0, 0, 25], lc)
-    member_56.add_distributed_load([0, 0, -25, 0, 0, -25], lc)
-    member_63.add_distributed_load([0, 0, -25, 0, 0, -25], lc, location="projection")
-
-    solver = LinearStaticSolver(model)
-    solver.solve()
+def assert_example_5_3(nodes, members, case):
+    """Assert the results of [2, Ex. 5.3] for ``case``."""
+    node_1, node_2, node_3, node_4 = nodes
+    member_12, member_32, member_34 = members
 
-    assert_almost_equal(node_1.results.reaction_force_x[lc], -57.903, decimal=3)
-    assert_almost_equal(node_1.results.reaction_force_z[lc], -116.803, decimal=2)
-    assert_almost_equal(node_1.results.reaction_moment_y[lc], 19.211, decimal=2)
+    assert_almost_equal(node_1.results.reaction_force_x[case], -11.131, decimal=3)
+    assert_almost_equal(node_1.results.reaction_force_z[case], 19.960, decimal=3)
+    assert_almost_equal(node_1.results.reaction_moment_y[case], -35.317, decimal=3)
 
-    assert_almost_equal(node_2.results.reaction_force_x[lc], 0, decimal=3)
-    assert_almost_equal(node_2.results.reaction_force_z[lc], 0, decimal=2)
-    assert_almost_equal(node_2.results.reaction_moment_y[lc], 0, decimal=2)
+    assert_almost_equal(node_2.results.translation_x[case], 4.452e-4)
+    assert_almost_equal(node_2.results.translation_z[case], 1.518e-3, decimal=6)
+    assert_almost_equal(node_2.results.rotation_y[case], -9.205e-4)
 
-    assert_almost_equal(node_3.results.reaction_force_x[lc], -57.903, decimal=3)
-    assert_almost_equal(node_3.results.reaction_force_z[lc], 116.803, decimal=2)
-    assert_almost_equal(node_3.results.reaction_moment_y[lc], 19.211, decimal=2)
+    assert_almost_equal(node_3.results.reaction_force_x[case], 11.131, decimal=3)
+    assert_almost_equal(node_3.results.reaction_force_z[case], -30.869, decimal=3)
 
-    assert_almost_equal(node_4.results.reaction_force_x[lc], 57.903, decimal=3)
-    assert_almost_equal(node_4.results.translation_z[lc], 2.864e-3)
-    assert_almost_equal(node_4.results.rotation_y[lc], 4.476e-4)
-
-    assert_almost_equal(node_6.results.reaction_force_x[lc], 57.903, decimal=3)
-    assert_almost_equal(node_6.results.translation_z[lc], -2.864e-3)
-    assert_almost_equal(node_6.results.rotation_y[lc], 4.476e-4)
+    assert_almost_equal(node_4.results.reaction_force_x[case], 0, decimal=3)
+    assert_almost_equal(node_4.results.reaction_force_z[case], 10.909, decimal=3)
+    assert_almost_equal(node_4.results.reaction_moment_y[case], 43.633, decimal=3)
 
     assert_array_almost_equal(
-        member_14.results.min_max_axial_forces[lc], [68.184, 128.184], decimal=2
+        member_12.results.min_max_axial_forces[case], [11.131, 11.131], decimal=3
     )
     assert_array_almost_equal(
-        member_14.results.min_max_shear_forces_z[lc], [-23.759, 21.241], decimal=2
+        member_12.results.min_max_shear_forces_z[case], [19.960, 19.960], decimal=3
     )
     assert_array_almost_equal(
-        member_14.results.min_max_bending_moments_y[lc], [-12.150, 19.211], decimal=2
+        member_12.results.min_max_bending_moments_y[case], [-35.317, 44.523], decimal=3
     )
 
     assert_array_almost_equal(
-        member_45.results.min_max_axial_forces[lc], [0, 0], decimal=2
+        member_32.results.min_max_axial_forces[case], [19.960, 19.960], decimal=3
     )
     assert_array_almost_equal(
-        member_45.results.min_max_shear_forces_z[lc], [-41.805, 33.195], decimal=2
+        member_32.results.min_max_shear_forces_z[case], [-11.131, -11.131], decimal=3
     )
     assert_array_almost_equal(
-        member_45.results.min_max_bending_moments_y[lc], [-22.037, 12.916], decimal=2
+        member_32.results.min_max_bending_moments_y[case], [-44.523, 0], decimal=3
     )
 
     assert_array_almost_equal(
-        member_25.results.min_max_axial_forces[lc], [0, 0], decimal=2
+        member_34.results.min_max_axial_forces[case], [0, 0], decimal=3
     )
     assert_array_almost_equal(
-        member_25.results.min_max_shear_forces_z[lc], [0, 0], decimal=2
+        member_34.results.min_max_shear_forces_z[case], [-10.909, -10.909], decimal=3
     )
     assert_array_almost_equal(
-        member_25.results.min_max_bending_moments_y[lc], [0, 0], decimal=2
+        member_34.results.min_max_bending_moments_y[case], [-43.633, 0], decimal=3
     )
 
-    assert_array_almost_equal(
-        member_56.results.min_max_axial_forces[lc], [0, 0], decimal=2
-    )
-    assert_array_almost_equal(
-        member_56.results.min_max_shear_forces_z[lc], [-41.805, 33.195], decimal=2
-    )
-    assert_array_almost_equal(
-        member_56.results.min_max_bending_moments_y[lc], [-12.916, 22.037], decimal=2
-    )
 
-    assert_array_almost_equal(
-        member_63.results.min_max_axial_forces[lc], [-128.184, -68.184], decimal=2
-    )
-    assert_array_almost_equal(
-        member_63.results.min_max_shear_forces_z[lc], [-23.759, 21.241], decimal=2
-    )
-    assert_array_almost_equal(
-        member_63.results.min_max_bending_moments_y[lc], [-19.211, 12.150], decimal=2
-    )
+def test_example_5_3(example_5_3) -> None:
+    """[2, Ex. 5.3] Frame under thermal load with prescribed displacements."""
+    nodes, members, lc, _ = example_5_3
+    assert_example_5_3(nodes, members, lc)
 
 
-def test_example_5_4_combinations() -> None:
-    """[2, Ex. 5.4] Symmetric frame under force load with prescribed displacements."""
+def test_example_5_3_combinations(example_5_3) -> None:
+    """[2, Ex. 5.3] Frame under thermal load with prescribed displacements."""
+    nodes, members, _, comb = example_5_3
+    assert_example_5_3(nodes, members, comb)
+
+
+@pytest.fixture(scope="module")
+def example_5_4():
+    """
+    [2, Ex. 5.4] Symmetric frame under force load with prescribed displacements.
+
+    The frame is solved once for the whole load in one load case and for the same load split into
+    scaled load cases of a combination, so both tests of the example share one analysis.
+    """
     material = Material("test", 30.0e6, 0.2, 12.0e-6, 0)
     section = Section(
         "test", 4.0e-3, 4.0e-3, 4.0e-3, 1.0e-3, 1.0e-3, 1.0e-3, 1, 1, material
@@ -588,106 +355,139 @@ def test_example_5_4_combinations() -> None:
     member_63 = model.add_member("6-3", "navier", [node_6, node_3], section)
 
     lc1 = model.add_load_case("LC1")
-    f1 = 5
-    node_1.add_prescribed_displacement(-0.003 / f1, "x", lc1)
+
+    node_1.add_prescribed_displacement(-0.003, "x", lc1)
+    node_3.add_prescribed_displacement(-0.003, "x", lc1)
+
+    member_14.add_distributed_load([0, 0, 25, 0, 0, 25], lc1, location="projection")
+    member_45.add_distributed_load([0, 0, 25, 0, 0, 25], lc1)
+    member_56.add_distributed_load([0, 0, -25, 0, 0, -25], lc1)
+    member_63.add_distributed_load([0, 0, -25, 0, 0, -25], lc1, location="projection")
 
     lc2 = model.add_load_case("LC2")
-    f2 = -3
-    node_3.add_prescribed_displacement(-0.003 / f2, "x", lc2)
+    f2 = 5
+    node_1.add_prescribed_displacement(-0.003 / f2, "x", lc2)
 
     lc3 = model.add_load_case("LC3")
-    f3 = -25
-    member_14.add_distributed_load(
-        np.array([0, 0, 25, 0, 0, 25]) / f3, lc3, location="projection"
-    )
+    f3 = -3
+    node_3.add_prescribed_displacement(-0.003 / f3, "x", lc3)
 
     lc4 = model.add_load_case("LC4")
-    f4 = 12.5
-    member_45.add_distributed_load(np.array([0, 0, 25, 0, 0, 25]) / f4, lc4)
+    f4 = -25
+    member_14.add_distributed_load(
+        np.array([0, 0, 25, 0, 0, 25]) / f4, lc4, location="projection"
+    )
 
     lc5 = model.add_load_case("LC5")
-    f5 = 0.2
-    member_56.add_distributed_load(np.array([0, 0, -25, 0, 0, -25]) / f5, lc5)
+    f5 = 12.5
+    member_45.add_distributed_load(np.array([0, 0, 25, 0, 0, 25]) / f5, lc5)
 
     lc6 = model.add_load_case("LC6")
-    f6 = 1.35
+    f6 = 0.2
+    member_56.add_distributed_load(np.array([0, 0, -25, 0, 0, -25]) / f6, lc6)
+
+    lc7 = model.add_load_case("LC7")
+    f7 = 1.35
     member_63.add_distributed_load(
-        np.array([0, 0, -25, 0, 0, -25]) / f6, lc6, location="projection"
+        np.array([0, 0, -25, 0, 0, -25]) / f7, lc7, location="projection"
     )
 
     comb = model.add_load_case_combination(
-        "CO1", {lc1: f1, lc2: f2, lc3: f3, lc4: f4, lc5: f5, lc6: f6}
+        "CO1", {lc2: f2, lc3: f3, lc4: f4, lc5: f5, lc6: f6, lc7: f7}
     )
 
     solver = LinearStaticSolver(model)
     solver.solve()
 
-    assert_almost_equal(node_1.results.reaction_force_x[comb], -57.903, decimal=3)
-    assert_almost_equal(node_1.results.reaction_force_z[comb], -116.803, decimal=2)
-    assert_almost_equal(node_1.results.reaction_moment_y[comb], 19.211, decimal=2)
+    nodes = (node_1, node_2, node_3, node_4, node_5, node_6)
+    members = (member_14, member_45, member_25, member_56, member_63)
+
+    return nodes, members, lc1, comb
+
 
-    assert_almost_equal(node_2.results.reaction_force_x[comb], 0, decimal=3)
-    assert_almost_equal(node_2.results.reaction_force_z[comb], 0, decimal=2)
-    assert_almost_equal(node_2.results.reaction_moment_y[comb], 0, decimal=2)
+def assert_example_5_4(nodes, members, case):
+    """Assert the results of [2, Ex. 5.4] for ``case``."""
+    node_1, node_2, node_3, node_4, _, node_6 = nodes
+    member_14, member_45, member_25, member_56, member_63 = members
 
-    assert_almost_equal(node_3.results.reaction_force_x[comb], -57.903, decimal=3)
-    assert_almost_equal(node_3.results.reaction_force_z[comb], 116.803, decimal=2)
-    assert_almost_equal(node_3.results.reaction_moment_y[comb], 19.211, decimal=2)
+    assert_almost_equal(node_1.results.reaction_force_x[case], -57.903, decimal=3)
+    assert_almost_equal(node_1.results.reaction_force_z[case], -116.803, decimal=2)
+    assert_almost_equal(node_1.results.reaction_moment_y[case], 19.211, decimal=2)
 
-    assert_almost_equal(node_4.results.reaction_force_x[comb], 57.903, decimal=3)
-    assert_almost_equal(node_4.results.translation_z[comb], 2.864e-3)
-    assert_almost_equal(node_4.results.rotation_y[comb], 4.476e-4)
+    assert_almost_equal(node_2.results.reaction_force_x[case], 0, decimal=3)
+    assert_almost_equal(node_2.results.reaction_force_z[case], 0, decimal=2)
+    assert_almost_equal(node_2.results.reaction_moment_y[case], 0, decimal=2)
 
-    assert_almost_equal(node_6.results.reaction_force_x[comb], 57.903, decimal=3)
-    assert_almost_equal(node_6.results.translation_z[comb], -2.864e-3)
-    assert_almost_equal(node_6.results.rotation_y[comb], 4.476e-4)
+    assert_almost_equal(node_3.results.reaction_force_x[case], -57.903, decimal=3)
+    assert_almost_equal(node_3.results.reaction_force_z[case], 116.803, decimal=2)
+    assert_almost_equal(node_3.results.reaction_moment_y[case], 19.211, decimal=2)
+
+    assert_almost_equal(node_4.results.reaction_force_x[case], 57.903, decimal=3)
+    assert_almost_equal(node_4.results.translation_z[case], 2.864e-3)
+    assert_almost_equal(node_4.results.rotation_y[case], 4.476e-4)
+
+    assert_almost_equal(node_6.results.reaction_force_x[case], 57.903, decimal=3)
+    assert_almost_equal(node_6.results.translation_z[case], -2.864e-3)
+    assert_almost_equal(node_6.results.rotation_y[case], 4.476e-4)
 
     assert_array_almost_equal(
-        member_14.results.min_max_axial_forces[comb], [68.184, 128.184], decimal=2
+        member_14.results.min_max_axial_forces[case], [68.184, 128.184], decimal=2
     )
     assert_array_almost_equal(
-        member_14.results.min_max_shear_forces_z[comb], [-23.759, 21.241], decimal=2
+        member_14.results.min_max_shear_forces_z[case], [-23.759, 21.241], decimal=2
     )
     assert_array_almost_equal(
-        member_14.results.min_max_bending_moments_y[comb], [-12.150, 19.211], decimal=2
+        member_14.results.min_max_bending_moments_y[case], [-12.150, 19.211], decimal=2
     )
 
     assert_array_almost_equal(
-        member_45.results.min_max_axial_forces[comb], [0, 0], decimal=2
+        member_45.results.min_max_axial_forces[case], [0, 0], decimal=2
     )
     assert_array_almost_equal(
-        member_45.results.min_max_shear_forces_z[comb], [-41.805, 33.195], decimal=2
+        member_45.results.min_max_shear_forces_z[case], [-41.805, 33.195], decimal=2
     )
     assert_array_almost_equal(
-        member_45.results.min_max_bending_moments_y[comb], [-22.037, 12.916], decimal=2
+        member_45.results.min_max_bending_moments_y[case], [-22.037, 12.916], decimal=2
     )
 
     assert_array_almost_equal(
-        member_25.results.min_max_axial_forces[comb], [0, 0], decimal=2
+        member_25.results.min_max_axial_forces[case], [0, 0], decimal=2
     )
     assert_array_almost_equal(
-        member_25.results.min_max_shear_forces_z[comb], [0, 0], decimal=2
+        member_25.results.min_max_shear_forces_z[case], [0, 0], decimal=2
     )
     assert_array_almost_equal(
-        member_25.results.min_max_bending_moments_y[comb], [0, 0], decimal=2
+        member_25.results.min_max_bending_moments_y[case], [0, 0], decimal=2
     )
 
     assert_array_almost_equal(
-        member_56.results.min_max_axial_forces[comb], [0, 0], decimal=2
+        member_56.results.min_max_axial_forces[case], [0, 0], decimal=2
     )
     assert_array_almost_equal(
-        member_56.results.min_max_shear_forces_z[comb], [-41.805, 33.195], decimal=2
+        member_56.results.min_max_shear_forces_z[case], [-41.805, 33.195], decimal=2
     )
     assert_array_almost_equal(
-        member_56.results.min_max_bending_moments_y[comb], [-12.916, 22.037], decimal=2
+        member_56.results.min_max_bending_moments_y[case], [-12.916, 22.037], decimal=2
     )
 
     assert_array_almost_equal(
-        member_63.results.min_max_axial_forces[comb], [-128.184, -68.184], decimal=2
+        member_63.results.min_max_axial_forces[case], [-128.184, -68.184], decimal=2
     )
     assert_array_almost_equal(
-        member_63.results.min_max_shear_forces_z[comb], [-23.759, 21.241], decimal=2
+        member_63.results.min_max_shear_forces_z[case], [-23.759, 21.241], decimal=2
     )
     assert_array_almost_equal(
-        member_63.results.min_max_bending_moments_y[comb], [-19.211, 12.150], decimal=2
+        member_63.results.min_max_bending_moments_y[case], [-19.211, 12.150], decimal=2
     )
+
+
+def test_example_5_4(example_5_4) -> None:
+    """[2, Ex. 5.4] Symmetric frame under force load with prescribed displacements."""
+    nodes, members, lc, _ = example_5_4
+    assert_example_5_4(nodes, members, lc)
+
+
+def test_example_5_4_combinations(example_5_4) -> None:
+    """[2, Ex. 5.4] Symmetric frame under force load with prescribed displacements."""
+    nodes, members, _, comb = example_5_4
+    assert_example_5_4(nodes, members, comb)
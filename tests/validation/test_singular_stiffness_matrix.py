@@ -5,9 +5,9 @@ from framesss.errors import SingularMatrixError
 from framesss.fea.models.frame_xz import FrameXZModel
 from framesss.pre.material import Material
 from framesss.pre.section import Section
+from framesss.solvers import linear_static
 from framesss.solvers.linear_static import LinearStaticSolver
 
-
 DUMMY_MAT = Material("foo", 1, 1, 1, 1)
 DUMMY_SEC = Section("bar", 1, 1, 1, 1, 1, 1, 1, 1, DUMMY_MAT)
 
@@ -39,3 +39,70 @@ def test_singular_stiffness_matrix() -> None:
 
     with pytest.raises(SingularMatrixError) as exc_info:
         solver.solve()
+
+
+STEEL = Material("steel", 210.0e9, 0.3, 1.2e-5, 7850.0)
+STEEL_SEC = Section("steel", 1e-2, 1e-2, 1e-2, 1e-4, 1e-4, 1e-4, 0.3, 0.3, STEEL)
+
+
+def build_inclined_four_bar_mechanism() -> FrameXZModel:
+    """Return a portal with inclined columns on pinned bases and a beam hinged at both ends."""
+    model = FrameXZModel()
+    node_1 = model.add_node(
+        "N1", [0.0, 0.0, 0.0], ["fixed", "free", "fixed", "free", "free", "free"]
+    )
+    node_2 = model.add_node("N2", [0.3, 0.0, 3.0])
+    node_3 = model.add_node("N3", [5.1, 0.0, 3.0])
+    node_4 = model.add_node(
+        "N4", [5.0, 0.0, 0.0], ["fixed", "free", "fixed", "free", "free", "free"]
+    )
+
+    model.add_member("M1", "navier", [node_1, node_2], STEEL_SEC)
+    member_2 = model.add_member(
+        "M2",
+        "navier",
+        [node_2, node_3],
+        STEEL_SEC,
+        hinges=[BeamConnection.HINGED_END, BeamConnection.HINGED_END],
+    )
+    model.add_member("M3", "navier", [node_4, node_3], STEEL_SEC)
+
+    load_case = model.add_load_case("LC1")
+    member_2.add_distributed_load([0, 0, -5, 0, 0, -5], load_case)
+    node_2.add_nodal_load([1, 0, 0, 0, 0, 0], load_case)
+
+    return model
+
+
+@pytest.mark.parametrize("max_dense_equations", [200, -1], ids=["dense", "sparse"])
+def test_inclined_four_bar_mechanism(monkeypatch, max_dense_equations) -> None:
+    """The mechanism must be detected regardless of the numbering of its DoFs."""
+    monkeypatch.setattr(linear_static, "MAX_DENSE_EQUATIONS", max_dense_equations)
+
+    # Nodes are numbered in the iteration order of the model's node set, which differs between
+    # model instances. The models are kept alive so that each one gets a fresh numbering.
+    models = [build_inclined_four_bar_mechanism() for _ in range(20)]
+
+    for model in models:
+        with pytest.raises(SingularMatrixError):
+            LinearStaticSolver(model).solve()
+
+
+@pytest.mark.parametrize("max_dense_equations", [200, -1], ids=["dense", "sparse"])
+def test_fully_fixed_beam(monkeypatch, capfd, max_dense_equations) -> None:
+    """A model without free DoFs has nothing to factorize, all loads go to the supports."""
+    monkeypatch.setattr(linear_static, "MAX_DENSE_EQUATIONS", max_dense_equations)
+
+    model = FrameXZModel()
+    node_1 = model.add_node("N1", [0.0, 0.0, 0.0], ["fixed"] * 6)
+    node_2 = model.add_node("N2", [2.0, 0.0, 0.0], ["fixed"] * 6)
+    member = model.add_member("M1", "navier", [node_1, node_2], DUMMY_SEC)
+
+    load_case = model.add_load_case("LC1")
+    member.add_distributed_load([0, 0, -1, 0, 0, -1], load_case)
+
+    LinearStaticSolver(model).solve()
+
+    assert node_1.results.reaction_force_z[load_case] == pytest.approx(1.0)
+    assert node_2.results.reaction_force_z[load_case] == pytest.approx(1.0)
+    assert capfd.readouterr().err == ""